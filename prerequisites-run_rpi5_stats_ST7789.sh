@@ -184,7 +184,7 @@ if [ ! -d "$VENV_DIR" ]; then
     # Install packages in virtual environment as backup
     print_status "Installing Python packages in virtual environment..."
     "$VENV_DIR/bin/pip" install --upgrade pip
-    "$VENV_DIR/bin/pip" install spidev psutil pillow
+    "$VENV_DIR/bin/pip" install spidev psutil pillow numpy
 
     # Install gpiod via pip if not available via apt
     if [ "${GPIOD_VIA_PIP:-false}" = true ]; then
@@ -147,7 +147,7 @@ if [ ! -d "$VENV_DIR" ]; then
     # Install packages in virtual environment as backup
     print_status "Installing Python packages in virtual environment..."
     "$VENV_DIR/bin/pip" install --upgrade pip
-    "$VENV_DIR/bin/pip" install spidev RPi.GPIO psutil pillow
+    "$VENV_DIR/bin/pip" install spidev RPi.GPIO psutil pillow numpy
     print_success "Packages installed in virtual environment"
 else
     print_success "Virtual environment already exists"
@@ -32,10 +32,18 @@ License: MIT
 """
 
 import time
+import functools
+import heapq
+import logging
+import os
 import socket
 import psutil
 import signal
 import sys
+import queue
+import selectors
+import threading
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import spidev
 import gpiod
@@ -46,16 +54,41 @@ DC_PIN = 25      # Data/Command pin for SPI display communication
 RST_PIN = 27     # Reset pin for display initialization (changed from 24 to avoid conflict)
 BTN_A_PIN = 23   # Bottom button (previous page navigation)
 BTN_B_PIN = 24   # Top button (next page navigation)
+BUTTON_ERROR_RETRY = 0.5  # Pause after a button read error before retrying (seconds)
+BUTTON_DEBOUNCE_NS = 50000000  # Ignore presses within 50ms of the last accepted one
 
 # Display Configuration
 # ====================
 WIDTH = 240      # Display width in pixels
 HEIGHT = 240     # Display height in pixels
-SPI_SPEED = 8000000  # SPI communication speed (8MHz)
+SPI_SPEED = 40000000  # SPI communication speed (40MHz; ST7789 is rated to ~62.5MHz)
+SPI_MODE = 0     # SPI mode 0 (CPOL=0, CPHA=0)
+SPI_BUFSIZ_PATH = '/sys/module/spidev/parameters/bufsiz'  # Max bytes per spidev transfer
+SPI_DEFAULT_BUFSIZ = 4096  # spidev default when the bufsiz parameter can't be read
+STATUS_Y = (140, 100, 155)  # Auto-cycle status line position for pages 0, 1 and 2
 
 # Auto-cycling Configuration
 # ==========================
 AUTO_CYCLE_INTERVAL = 120.0  # Auto-cycle every 2 minutes (120 seconds)
+PAGE_REFRESH_INTERVALS = (3.0, 3.0, 1.5)  # Seconds between data refreshes for pages 0, 1 and 2
+# Every possible auto-cycle countdown label, indexed by whole seconds remaining
+AUTO_STRS = [f"Auto: {secs // 60}:{secs % 60:02d}" for secs in range(int(AUTO_CYCLE_INTERVAL) + 1)]
+
+# Logging Configuration
+# =====================
+LOG_LEVEL = logging.WARNING  # Set to logging.DEBUG to log every page change
+log = logging.getLogger(__name__)
+
+# Stats Configuration
+# ===================
+SYSTEM_DATA_MAX_AGE = 1.0  # Reuse CPU, RAM and temperature readings younger than this (seconds)
+IP_ADDRESS_MAX_AGE = 60.0  # Reuse the local IP address younger than this (seconds)
+IP_INTERFACE_PREFIXES = ("eth", "wlan")  # LAN interfaces preferred for the shown IP, in order
+DISK_USAGE_MAX_AGE = 30.0  # Reuse root filesystem usage younger than this (seconds)
+NETWORK_INFO_MAX_AGE = 3.0  # Reuse interface counters younger than this (seconds)
+INTERFACE_MAX_AGE = 30.0  # Reuse the chosen ethernet interface name younger than this (seconds)
+TOP_PROCESSES_MAX_AGE = 1.5  # Reuse the process list younger than this (seconds)
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'  # CPU temperature in millidegrees C
 
 # Color Definitions
 # ================
@@ -72,6 +105,57 @@ BRIGHT_YELLOW = (255, 255, 0)   # System Info page title
 BRIGHT_BLUE = (0, 150, 255)     # Network Info page title
 BRIGHT_ORANGE = (255, 165, 0)   # Top Processes page title
 
+# Page Labels
+# ===========
+# Static text, defined once so page refreshes only build the live values
+TITLE_SYSTEM = "-- SYSTEM INFO --"        # Page 0 title
+TITLE_NETWORK = "-- NETWORK INFO --"      # Page 1 title
+TITLE_PROCESSES = "-- TOP PROCESSES --"   # Page 2 title
+NAV_TOP = "Top: Next ->"                  # Top button hint
+NAV_BOTTOM = "Bottom: <- Prev"            # Bottom button hint
+LBL_IP = "IP: "
+LBL_CPU = "CPU: "
+LBL_RAM = "RAM: "
+LBL_DISK = "Disk: "
+LBL_TEMP = "Temp: "
+LBL_INTERFACE = "Interface: "
+LBL_SENT = "Sent: "
+LBL_RECEIVED = "Received: "
+
+# Full-screen black frame in RGB565 (built once, reused by every clear)
+BLACK_FRAME = bytes(WIDTH * HEIGHT * 2)
+
+# Address window with Mini PiTFT offset for 180° rotation
+CASET_FULL = bytes([0x00, 0x00, 0x00, 0xEF])  # Columns 0 to 239
+ROW_OFFSET = 80  # Panel row 0 is controller row 80 (Mini PiTFT offset)
+
+# ST7789 Initialization Sequence
+# ==============================
+# (command, argument bytes, delay in seconds after the command)
+INIT_SEQUENCE = [
+    (0x01, b'', 0.15),                          # Software reset
+    (0x11, b'', 0.25),                          # Sleep out (exit sleep mode)
+    (0x36, b'\xC0', 0),                         # Memory Access Control: 180° rotation
+    (0x3A, b'\x55', 0),                         # Interface Pixel Format: 16-bit RGB565
+    (0x2A, CASET_FULL, 0),                      # Column address set: 0 to 239
+    (0x2B, b'\x00\x50\x01\x3F', 0),             # Row address set: 80 to 319 (Mini PiTFT offset)
+    (0xB2, b'\x0C\x0C\x00\x33\x33', 0),         # Porch control
+    (0xB7, b'\x35', 0),                         # Gate control
+    (0xBB, b'\x19', 0),                         # VCOM setting
+    (0xC0, b'\x2C', 0),                         # LCM control
+    (0xC2, b'\x01', 0),                         # VDV and VRH command enable
+    (0xC3, b'\x12', 0),                         # VRH set
+    (0xC4, b'\x20', 0),                         # VDV set
+    (0xC6, b'\x0F', 0),                         # Frame rate control
+    (0xD0, b'\xA4\xA1', 0),                     # Power control
+    (0xE0, bytes([0xD0, 0x04, 0x0D, 0x11, 0x13, 0x2B, 0x3F, 0x54,
+                  0x4C, 0x18, 0x0D, 0x0B, 0x1F, 0x23]), 0),  # Positive voltage gamma control
+    (0xE1, bytes([0xD0, 0x04, 0x0C, 0x11, 0x13, 0x2C, 0x3F, 0x44,
+                  0x51, 0x2F, 0x1F, 0x1F, 0x20, 0x23]), 0),  # Negative voltage gamma control
+    (0x21, b'', 0),                             # Display inversion on (improves color accuracy)
+    (0x13, b'', 0),                             # Normal display mode
+]
+
 # Global State Variables
 # =====================
 spi = None                      # SPI device handle
@@ -80,13 +164,28 @@ dc_line = None                 # DC pin line
 rst_line = None                # Reset pin line
 btn_a_line = None              # Button A line
 btn_b_line = None              # Button B line
+button_lines = None            # Both button lines as one bulk request (polling fallback)
+button_selector = None         # Selector over the button event fds (v1.x edge events)
+button_events = queue.Queue()  # Page steps (-1/+1) from the polling button thread
+last_press_ns = {BTN_A_PIN: 0, BTN_B_PIN: 0}  # Edge time of last accepted press per pin
+spi_chunk_size = SPI_DEFAULT_BUFSIZ  # Bytes per SPI transfer for pixel data
+frame_buffers = [bytearray(WIDTH * HEIGHT * 2) for _ in range(2)]  # Ping-pong big-endian RGB565 frames
+rgb565_scratch = np.empty((2, HEIGHT, WIDTH), dtype=np.uint16)  # Reused red/green planes for the RGB565 pack
+frame_buffer_free = [threading.Semaphore(1) for _ in range(2)]  # Held while a buffer is in use
+next_frame_buffer = 0          # Buffer the next frame is rendered into
+frame_queue = queue.Queue(maxsize=1)  # Index of the next frame buffer for the display thread
+display_thread = None          # Thread streaming frames over SPI
+shown_frame = None             # Copy of the RGB565 bytes currently in display memory
 running = True                 # Main loop control flag
 current_page = 0              # Current displayed page (0=System, 1=Network, 2=Processes)
-last_button_a_state = False   # Previous state of button A (for debouncing)
-last_button_b_state = False   # Previous state of button B (for debouncing)
-last_auto_cycle_time = 0      # Time of last auto-cycle
-last_manual_interaction = 0   # Time of last manual button press
+last_auto_cycle_time = 0      # Monotonic time of last auto-cycle
+last_manual_interaction = float("-inf")  # Monotonic time of last manual button press
 manual_override_duration = 10.0  # How long to wait after manual interaction before resuming auto-cycle
+page_backgrounds = {}          # Static page chrome by page number, rendered on first use
+page_images = [Image.new("RGB", (WIDTH, HEIGHT), BLACK) for _ in range(2)]  # Reused page canvases
+next_page_image = 0            # Page canvas the next create_page() draws into
+shown_page_key = None          # (page_num, text lines) of the page last pushed to the display
+thermal_fd = None              # Open fd on THERMAL_ZONE_PATH, reread with pread
 
 def cleanup():
     """
@@ -98,6 +197,10 @@ def cleanup():
     global running, spi, gpio_chip, dc_line, rst_line, btn_a_line, btn_b_line
     running = False
     try:
+        # Let the display thread finish its current frame before closing SPI
+        if display_thread and display_thread is not threading.current_thread():
+            queue_frame(None)
+            display_thread.join(timeout=1.0)
         if spi:
             spi.close()
         # Release GPIO lines properly for RPi 5
@@ -109,8 +212,12 @@ def cleanup():
             btn_a_line.release()
         if btn_b_line:
             btn_b_line.release()
+        if button_selector:
+            button_selector.close()
         if gpio_chip:
             gpio_chip.close()
+        if thermal_fd is not None:
+            os.close(thermal_fd)
     except:
         pass
 
@@ -142,35 +249,51 @@ def write_data(data):
     """
     Send data byte(s) to the display via SPI.
 
+    Bytes-like buffers are sent write-only with writebytes2, which reads
+    the buffer directly instead of unpacking it into a list of ints.
+
     Args:
-        data (int or list): Data byte or list of bytes to send
+        data (int, list or bytes-like): Data byte, list of bytes or bytes buffer to send
     """
     if not running:
         return
     dc_line.set_value(1)  # Set DC high for data mode
-    if isinstance(data, list):
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        spi.writebytes2(data)
+    elif isinstance(data, list):
         spi.xfer2(data)
     else:
         spi.xfer2([data])
 
-def rgb_to_rgb565(r, g, b):
+def set_window_rows(first_row, last_row):
     """
-    Convert RGB888 color to RGB565 format for display.
+    Set a full-width address window over a band of rows and start a memory write.
 
-    The ST7789 display uses 16-bit RGB565 color format:
-    - Red: 5 bits (bits 15-11)
-    - Green: 6 bits (bits 10-5)
-    - Blue: 5 bits (bits 4-0)
+    Issues the column address, row address and memory write commands
+    with prebuilt argument buffers, then leaves DC high so the caller
+    can stream pixel data with spi.writebytes2 without touching the DC
+    line again for every chunk.
 
     Args:
-        r (int): Red component (0-255)
-        g (int): Green component (0-255)
-        b (int): Blue component (0-255)
-
-    Returns:
-        int: 16-bit RGB565 color value
+        first_row (int): First panel row to write (0 to HEIGHT-1)
+        last_row (int): Last panel row to write, inclusive
     """
-    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+    start = ROW_OFFSET + first_row
+    end = ROW_OFFSET + last_row
+
+    dc_line.set_value(0)
+    spi.writebytes2(b'\x2A')  # Column address
+    dc_line.set_value(1)
+    spi.writebytes2(CASET_FULL)
+
+    dc_line.set_value(0)
+    spi.writebytes2(b'\x2B')  # Row address
+    dc_line.set_value(1)
+    spi.writebytes2(bytes([start >> 8, start & 0xFF, end >> 8, end & 0xFF]))
+
+    dc_line.set_value(0)
+    spi.writebytes2(b'\x2C')  # Memory write
+    dc_line.set_value(1)  # Pixel data follows
 
 def clear_display_memory():
     """
@@ -179,28 +302,117 @@ def clear_display_memory():
     Sets the display window to full screen and fills it with black pixels.
     This prevents display artifacts and ensures clean startup.
     """
-    # Set full display area
-    write_cmd(0x2A)  # Column address
-    write_data([0x00, 0x00, 0x00, 0xEF])  # 0 to 239
+    global shown_frame
 
-    write_cmd(0x2B)  # Row address
-    write_data([0x00, 0x50, 0x01, 0x3F])  # 80 to 319 (Mini PiTFT offset)
+    if not running:
+        return
 
-    write_cmd(0x2C)  # Memory write
+    set_window_rows(0, HEIGHT - 1)
 
-    # Send black pixels to entire display
-    black_pixel = [0x00, 0x00]  # Black in RGB565 format
-    total_pixels = WIDTH * HEIGHT
+    # Send the prebuilt black frame to entire display
+    black = memoryview(BLACK_FRAME)
 
-    # Send pixels in chunks for efficiency
-    chunk_size = 1024
-    for i in range(0, total_pixels * 2, chunk_size):
-        if not running:
-            break
-        chunk = black_pixel * (chunk_size // 2)
-        write_data(chunk)
+    # Send pixels in transfers as large as spidev allows
+    for i in range(0, len(black), spi_chunk_size):
+        spi.writebytes2(black[i:i + spi_chunk_size])
+
+    shown_frame = bytearray(BLACK_FRAME)
+
+def get_spi_bufsiz():
+    """
+    Read the spidev kernel transfer buffer size.
+
+    spidev rejects transfers larger than this, so it sets the largest
+    chunk we can push in one ioctl. It defaults to 4096 bytes and can be
+    raised with the spidev.bufsiz=65536 kernel parameter.
+
+    Returns:
+        int: Maximum bytes per SPI transfer
+    """
+    try:
+        with open(SPI_BUFSIZ_PATH, 'r') as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return SPI_DEFAULT_BUFSIZ
+
+def open_spi():
+    """
+    Open the display's SPI device and configure it once.
+
+    spidev reads the current mode and clock when the device is opened,
+    and every setter is an ioctl, so settings are only written when they
+    differ from what the driver already has. This is the only place SPI
+    settings are changed; nothing on the frame path reconfigures the bus.
+
+    Returns:
+        spidev.SpiDev: Open, configured SPI device
+    """
+    device = spidev.SpiDev()
+    device.open(0, 0)  # SPI bus 0, device 0
+    if device.mode != SPI_MODE:
+        device.mode = SPI_MODE
+    if device.max_speed_hz != SPI_SPEED:
+        # Never rejected: the controller clamps and divides it silently
+        device.max_speed_hz = SPI_SPEED
+    return device
+
+def init_sequence():
+    """
+    Reset and initialize the ST7789, yielding instead of sleeping.
+
+    Each yield is the minimum number of seconds the controller needs
+    before the next step, so the caller decides what to do with the wait
+    (see run_init_sequence()).
+
+    Yields:
+        float: Seconds to wait before resuming
+    """
+    # Hardware reset sequence
+    rst_line.set_value(0)  # Reset low
+    yield 0.1
+    rst_line.set_value(1)    # Reset high
+    yield 0.12
+
+    # Send the ST7789 initialization sequence
+    for cmd, args, delay in INIT_SEQUENCE:
+        write_cmd(cmd)
+        if args:
+            write_data(args)
+        if delay:
+            yield delay
+
+    # Clear display memory before turning on
+    print("Clearing display memory...")
+    clear_display_memory()
+
+    # Display on
+    write_cmd(0x29)
+    yield 0.1
+
+def run_init_sequence(warmup_tasks=()):
+    """
+    Run init_sequence(), doing warm-up work during its delays.
+
+    About 0.6s of init is spent waiting on the controller. Rather than
+    sleeping through it, each warm-up task is started while a wait still
+    has time left, and the remainder of the wait is slept as before.
+    Tasks that don't fit in the waits run once the display is up.
 
-def init_display():
+    Args:
+        warmup_tasks (iterable): Callables to run during the waits
+    """
+    tasks = list(warmup_tasks)
+    for wait in init_sequence():
+        deadline = time.monotonic() + wait
+        while tasks and time.monotonic() < deadline:
+            tasks.pop(0)()
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+    for task in tasks:
+        task()
+
+def init_display(warmup_tasks=()):
     """
     Initialize the ST7789 display with proper configuration for Raspberry Pi 5.
 
@@ -211,10 +423,14 @@ def init_display():
     - 180° rotation configuration
     - Display memory clearing
 
+    Args:
+        warmup_tasks (iterable): Callables to run while waiting on the controller
+
     Returns:
         bool: True if initialization successful, False otherwise
     """
-    global spi, gpio_chip, dc_line, rst_line, btn_a_line, btn_b_line
+    global spi, gpio_chip, dc_line, rst_line, btn_a_line, btn_b_line, spi_chunk_size
+    global button_lines, button_selector, display_thread
 
     print("Initializing display for Raspberry Pi 5...")
 
@@ -252,13 +468,19 @@ def init_display():
             rst_line = gpio_chip.get_line(RST_PIN)
             rst_line.request(consumer="pitft_rst", type=gpiod.LINE_REQ_DIR_OUT)
 
+            # Buttons deliver falling-edge events (press = high to low)
             btn_a_line = gpio_chip.get_line(BTN_A_PIN)
-            btn_a_line.request(consumer="pitft_btn_a", type=gpiod.LINE_REQ_DIR_IN,
+            btn_a_line.request(consumer="pitft_btn_a", type=gpiod.LINE_REQ_EV_FALLING_EDGE,
                               flags=gpiod.LINE_REQ_FLAG_BIAS_PULL_UP)
 
             btn_b_line = gpio_chip.get_line(BTN_B_PIN)
-            btn_b_line.request(consumer="pitft_btn_b", type=gpiod.LINE_REQ_DIR_IN,
+            btn_b_line.request(consumer="pitft_btn_b", type=gpiod.LINE_REQ_EV_FALLING_EDGE,
                               flags=gpiod.LINE_REQ_FLAG_BIAS_PULL_UP)
+
+            # The main loop waits on both event fds instead of polling
+            button_selector = selectors.DefaultSelector()
+            for line in (btn_a_line, btn_b_line):
+                button_selector.register(line.event_get_fd(), selectors.EVENT_READ, line)
         else:
             # v0.x API
             dc_line = gpio_chip.get_line(DC_PIN)
@@ -267,13 +489,12 @@ def init_display():
             rst_line = gpio_chip.get_line(RST_PIN)
             rst_line.request(consumer="pitft_rst", direction=gpiod.LINE_REQ_DIR_OUT)
 
+            # Request both buttons together so one ioctl reads them both
             btn_a_line = gpio_chip.get_line(BTN_A_PIN)
-            btn_a_line.request(consumer="pitft_btn_a", direction=gpiod.LINE_REQ_DIR_IN,
-                              bias=gpiod.LINE_REQ_FLAG_BIAS_PULL_UP)
-
             btn_b_line = gpio_chip.get_line(BTN_B_PIN)
-            btn_b_line.request(consumer="pitft_btn_b", direction=gpiod.LINE_REQ_DIR_IN,
-                              bias=gpiod.LINE_REQ_FLAG_BIAS_PULL_UP)
+            button_lines = gpiod.LineBulk([btn_a_line, btn_b_line])
+            button_lines.request(consumer="pitft_buttons", direction=gpiod.LINE_REQ_DIR_IN,
+                                 bias=gpiod.LINE_REQ_FLAG_BIAS_PULL_UP)
 
         print("GPIO initialized for Raspberry Pi 5")
 
@@ -283,180 +504,205 @@ def init_display():
 
     # Initialize SPI communication
     try:
-        spi = spidev.SpiDev()
-        spi.open(0, 0)  # SPI bus 0, device 0
-        spi.max_speed_hz = SPI_SPEED
-        spi.mode = 0    # SPI mode 0 (CPOL=0, CPHA=0)
-        print(f"SPI initialized at {SPI_SPEED} Hz")
+        spi = open_spi()
+        spi_chunk_size = get_spi_bufsiz()
+        # spidev reports the requested rate, not the divided bus clock
+        print(f"SPI initialized at {spi.max_speed_hz} Hz requested ({spi_chunk_size} byte transfers)")
     except Exception as e:
         print(f"SPI failed: {e}")
         return False
 
-    # Hardware reset sequence
-    rst_line.set_value(0)  # Reset low
-    time.sleep(0.1)
-    rst_line.set_value(1)    # Reset high
-    time.sleep(0.12)
-
     try:
-        # ST7789 initialization sequence
-        # ==============================
-
-        # Software reset
-        write_cmd(0x01)
-        time.sleep(0.15)
-
-        # Sleep out (exit sleep mode)
-        write_cmd(0x11)
-        time.sleep(0.25)
-
-        # Set 180° rotation for proper Mini PiTFT orientation
-        write_cmd(0x36)  # Memory Access Control
-        write_data([0xC0])  # 180° rotation
+        # Reset and initialize the controller, warming up stats in the gaps
+        run_init_sequence(warmup_tasks)
 
-        # Set color format to 16-bit RGB565
-        write_cmd(0x3A)  # Interface Pixel Format
-        write_data([0x55])  # 16-bit color
+        # From here on all pixel data goes through the display thread
+        display_thread = threading.Thread(target=display_worker, daemon=True)
+        display_thread.start()
 
-        # Set display area for 1.3" Mini PiTFT with 180° rotation
-        # Column address set (X coordinates)
-        write_cmd(0x2A)
-        write_data([0x00, 0x00, 0x00, 0xEF])  # 0 to 239
-
-        # Row address set (Y coordinates with Mini PiTFT offset)
-        write_cmd(0x2B)
-        write_data([0x00, 0x50, 0x01, 0x3F])  # 80 to 319 (Mini PiTFT specific offset)
-
-        # Porch control
-        write_cmd(0xB2)
-        write_data([0x0C, 0x0C, 0x00, 0x33, 0x33])
-
-        # Gate control
-        write_cmd(0xB7)
-        write_data([0x35])
+        print("Display initialized with 180° rotation and cleared memory")
+        return True
 
-        # VCOM setting
-        write_cmd(0xBB)
-        write_data([0x19])
+    except Exception as e:
+        print(f"Display initialization failed: {e}")
+        return False
 
-        # LCM control
-        write_cmd(0xC0)
-        write_data([0x2C])
+def send_frame(index):
+    """
+    Send the rows of a frame buffer that differ from display memory.
 
-        # VDV and VRH command enable
-        write_cmd(0xC2)
-        write_data([0x01])
+    Compares the frame with shown_frame row by row and streams only the
+    band from the first to the last changed row, straight out of the
+    frame buffer. An identical frame sends nothing. Typical refreshes
+    only change a few text lines, so this is a small fraction of the
+    full 115KB.
 
-        # VRH set
-        write_cmd(0xC3)
-        write_data([0x12])
+    Args:
+        index (int): Index into frame_buffers of the frame to send
+    """
+    global shown_frame
 
-        # VDV set
-        write_cmd(0xC4)
-        write_data([0x20])
+    if not running:
+        return
 
-        # Frame rate control
-        write_cmd(0xC6)
-        write_data([0x0F])
+    frame = frame_buffers[index]
+    if shown_frame is None:
+        first_row, last_row = 0, HEIGHT - 1
+    else:
+        new_rows = np.frombuffer(frame, dtype=np.uint16).reshape(HEIGHT, WIDTH)
+        old_rows = np.frombuffer(shown_frame, dtype=np.uint16).reshape(HEIGHT, WIDTH)
+        dirty_rows = np.flatnonzero((new_rows != old_rows).any(axis=1))
+        if dirty_rows.size == 0:
+            return
+        first_row, last_row = int(dirty_rows[0]), int(dirty_rows[-1])
 
-        # Power control
-        write_cmd(0xD0)
-        write_data([0xA4, 0xA1])
+    start = first_row * WIDTH * 2
+    end = (last_row + 1) * WIDTH * 2
+    pixels = memoryview(frame)[start:end]
 
-        # Positive voltage gamma control
-        write_cmd(0xE0)
-        write_data([0xD0, 0x04, 0x0D, 0x11, 0x13, 0x2B, 0x3F, 0x54,
-                   0x4C, 0x18, 0x0D, 0x0B, 0x1F, 0x23])
+    set_window_rows(first_row, last_row)
 
-        # Negative voltage gamma control
-        write_cmd(0xE1)
-        write_data([0xD0, 0x04, 0x0C, 0x11, 0x13, 0x2C, 0x3F, 0x44,
-                   0x51, 0x2F, 0x1F, 0x1F, 0x20, 0x23])
+    # Send pixel data in transfers as large as spidev allows
+    for i in range(0, len(pixels), spi_chunk_size):
+        spi.writebytes2(pixels[i:i + spi_chunk_size])
 
-        # Display inversion on (improves color accuracy)
-        write_cmd(0x21)
+    if shown_frame is None:
+        shown_frame = bytearray(frame)
+    else:
+        shown_frame[start:end] = pixels
 
-        # Normal display mode
-        write_cmd(0x13)
+def display_worker():
+    """
+    Send queued frames to the display on a background thread.
 
-        # Clear display memory before turning on
-        print("Clearing display memory...")
-        clear_display_memory()
+    Runs the SPI transfer of frame N while the main thread renders and
+    converts frame N+1. Exits when it receives None or running is cleared.
+    """
+    global shown_frame
 
-        # Display on
-        write_cmd(0x29)
-        time.sleep(0.1)
+    while running:
+        index = frame_queue.get()
+        if index is None:
+            break
+        try:
+            send_frame(index)
+        except Exception as e:
+            shown_frame = None  # Display memory is unknown; resend the next frame in full
+            if running:
+                log.warning("Display error: %s", e)
+        finally:
+            frame_buffer_free[index].release()
+
+def queue_frame(index):
+    """
+    Hand a frame buffer to the display thread, replacing any frame still waiting.
 
-        print("Display initialized with 180° rotation and cleared memory")
-        return True
+    Only the newest frame matters, so a frame that has not started
+    sending yet is dropped (and its buffer freed) rather than letting
+    updates back up.
 
-    except Exception as e:
-        print(f"Display initialization failed: {e}")
-        return False
+    Args:
+        index (int or None): Index into frame_buffers, or None to stop the display thread
+    """
+    try:
+        frame_queue.put_nowait(index)
+    except queue.Full:
+        try:
+            dropped = frame_queue.get_nowait()
+            if dropped is not None:
+                frame_buffer_free[dropped].release()
+        except queue.Empty:
+            pass
+        frame_queue.put_nowait(index)
 
 def display_image_corrected(image):
     """
     Display an image on the ST7789 display with proper memory mapping.
 
-    Converts PIL Image to RGB565 format and sends to display memory.
-    Handles the Mini PiTFT's specific memory offset and 180° rotation.
+    Converts PIL Image to RGB565 format into the free one of two reusable
+    frame buffers and queues it for the display thread, which sends it to
+    display memory. Handles the Mini PiTFT's specific memory offset and
+    180° rotation.
 
     Args:
         image (PIL.Image): Image to display (will be converted to RGB if needed)
     """
+    global next_frame_buffer
+
     if not running:
         return
 
-    # Ensure image is in RGB format
-    rgb_image = image.convert('RGB')
+    # Ensure image is in RGB format (pages are already RGB, so skip the copy)
+    rgb_image = image if image.mode == 'RGB' else image.convert('RGB')
 
-    # Set display area with Mini PiTFT offset for 180° rotation
-    write_cmd(0x2A)  # Column address
-    write_data([0x00, 0x00, 0x00, 0xEF])  # 0 to 239
+    # Pad/crop to the panel size so the pixel array is exactly HEIGHT x WIDTH
+    if rgb_image.size != (WIDTH, HEIGHT):
+        canvas = Image.new("RGB", (WIDTH, HEIGHT), BLACK)
+        canvas.paste(rgb_image)
+        rgb_image = canvas
 
-    write_cmd(0x2B)  # Row address
-    write_data([0x00, 0x50, 0x01, 0x3F])  # 80 to 319 (Mini PiTFT offset)
+    # Wait until the display thread is done with the buffer we render into
+    index = next_frame_buffer
+    while not frame_buffer_free[index].acquire(timeout=0.5):
+        if not running:
+            return
+    next_frame_buffer ^= 1
+
+    # Take the raw RGB888 bytes straight from libImaging and pack all
+    # pixels to the ST7789's 16-bit RGB565 format (red in bits 15-11, green
+    # in bits 10-5, blue in bits 4-0) in place in the scratch planes, so no
+    # per-frame temporaries are allocated
+    raw = np.frombuffer(rgb_image.tobytes(), dtype=np.uint8).reshape(HEIGHT, WIDTH, 3)
+    red, green = rgb565_scratch
+    np.bitwise_and(raw[..., 0], 0xF8, out=red)
+    np.left_shift(red, 8, out=red)
+    np.bitwise_and(raw[..., 1], 0xFC, out=green)
+    np.left_shift(green, 3, out=green)
+    np.bitwise_or(red, green, out=red)
+    np.right_shift(raw[..., 2], 3, out=green)
+    np.bitwise_or(red, green, out=red)
+
+    # Store big-endian (high byte first, as the ST7789 expects) directly
+    # into the frame buffer
+    frame = np.frombuffer(frame_buffers[index], dtype='>u2').reshape(HEIGHT, WIDTH)
+    frame[...] = red
+
+    queue_frame(index)
 
-    write_cmd(0x2C)  # Memory write
+# Font Configuration
+# ==================
+@functools.lru_cache(maxsize=32)
+def load_font(path, size):
+    """
+    Load a TrueType font, parsing each (path, size) pair only once.
 
-    # Convert PIL image pixels to RGB565 format
-    pixels = []
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            if x < rgb_image.width and y < rgb_image.height:
-                r, g, b = rgb_image.getpixel((x, y))
-            else:
-                r, g, b = 0, 0, 0  # Black for areas outside image bounds
+    Parsing a font file is far more expensive than drawing with it, so
+    any code that needs a face at a given size should come through here
+    rather than calling ImageFont.truetype directly.
 
-            # Convert to RGB565 and split into high/low bytes
-            rgb565 = rgb_to_rgb565(r, g, b)
-            pixels.append((rgb565 >> 8) & 0xFF)  # High byte
-            pixels.append(rgb565 & 0xFF)         # Low byte
+    Args:
+        path (str): Path to the .ttf file
+        size (int): Font size in points
 
-    # Send pixel data in chunks for efficiency
-    chunk_size = 1024
-    for i in range(0, len(pixels), chunk_size):
-        if not running:
-            break
-        chunk = pixels[i:i + chunk_size]
-        write_data(chunk)
+    Returns:
+        ImageFont.FreeTypeFont: Loaded font
+    """
+    return ImageFont.truetype(path, size)
 
-# Font Configuration
-# ==================
 try:
     # Try to load UbuntuNerdFont with multiple possible paths
-    font = ImageFont.truetype('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuMonoNerdFont-Regular.ttf', 20)
-    font_title = ImageFont.truetype('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuMonoNerdFont-Bold.ttf', 22)
-    font_title_small = ImageFont.truetype('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuMonoNerdFont-Bold.ttf', 21)  # 1pt smaller for page 2
-    font_small = ImageFont.truetype('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuMonoNerdFont-Regular.ttf', 16)  # Small font for auto-cycle indicator
+    font = load_font('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuMonoNerdFont-Regular.ttf', 20)
+    font_title = load_font('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuMonoNerdFont-Bold.ttf', 22)
+    font_title_small = load_font('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuMonoNerdFont-Bold.ttf', 21)  # 1pt smaller for page 2
+    font_small = load_font('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuMonoNerdFont-Regular.ttf', 16)  # Small font for auto-cycle indicator
     print("Ubuntu Nerd Font loaded (MonoNerdFont)")
 except:
     try:
         # Fallback to alternative UbuntuNerdFont path
-        font = ImageFont.truetype('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuNerdFont-Regular.ttf', 20)
-        font_title = ImageFont.truetype('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuNerdFont-Bold.ttf', 22)
-        font_title_small = ImageFont.truetype('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuNerdFont-Bold.ttf', 21)  # 1pt smaller for page 2
-        font_small = ImageFont.truetype('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuNerdFont-Regular.ttf', 16)  # Small font for auto-cycle indicator
+        font = load_font('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuNerdFont-Regular.ttf', 20)
+        font_title = load_font('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuNerdFont-Bold.ttf', 22)
+        font_title_small = load_font('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuNerdFont-Bold.ttf', 21)  # 1pt smaller for page 2
+        font_small = load_font('/usr/share/fonts/truetype/UbuntuNerdFont/UbuntuNerdFont-Regular.ttf', 16)  # Small font for auto-cycle indicator
         print("Ubuntu Nerd Font loaded (NerdFont)")
     except:
         # Use system default fonts as last resort
@@ -466,6 +712,100 @@ except:
         font_small = ImageFont.load_default()
         print("Using default fonts (UbuntuNerdFont not found)")
 
+# multiline_text advances each line by the height of "A" plus spacing;
+# pick the spacing that keeps value lines 20px apart
+value_line_spacing = 20 - font.getbbox("A")[3]
+
+# Prime CPU usage sampling: the first non-blocking call has no baseline
+psutil.cpu_percent(interval=None)
+
+def ttl_cache(seconds):
+    """
+    Decorator that reuses a function's result for a fixed number of seconds.
+
+    Meant for the argument-free stats getters: repeated renders within the
+    window (e.g. rapid button presses) return the stored value instead of
+    querying /proc and /sys again.
+
+    Args:
+        seconds (float): How long a result stays valid
+
+    Returns:
+        function: Decorator wrapping a function that takes no arguments
+    """
+    def decorator(func):
+        cache = {}  # "entry" -> (monotonic timestamp, value)
+
+        @functools.wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            entry = cache.get("entry")
+            if entry is not None and now - entry[0] < seconds:
+                return entry[1]
+            value = func()
+            cache["entry"] = (now, value)
+            return value
+
+        return wrapper
+    return decorator
+
+@ttl_cache(IP_ADDRESS_MAX_AGE)
+def get_ip_address():
+    """
+    Look up the local IPv4 address from the network interfaces.
+
+    Picks a non-loopback IPv4 address on an interface that is up,
+    preferring eth* and then wlan* interfaces (IP_INTERFACE_PREFIXES) so
+    VPN, USB gadget or container bridge addresses are only shown when
+    there is no LAN address. This reads interface state directly instead
+    of opening a socket, so it keeps working during brief connectivity
+    drops. The address almost never changes, so results are reused if
+    they are less than IP_ADDRESS_MAX_AGE seconds old.
+
+    Returns:
+        str: Local IP address, or "No Connection"
+    """
+    try:
+        addrs = psutil.net_if_addrs()
+        stats = psutil.net_if_stats()
+        candidates = {}  # Preference rank -> first usable address
+        for interface, interface_addrs in addrs.items():
+            if interface not in stats or not stats[interface].isup:
+                continue
+            rank = next((i for i, prefix in enumerate(IP_INTERFACE_PREFIXES)
+                         if interface.startswith(prefix)), len(IP_INTERFACE_PREFIXES))
+            if rank in candidates:
+                continue
+            for addr in interface_addrs:
+                if addr.family == socket.AF_INET and not addr.address.startswith("127."):
+                    candidates[rank] = addr.address
+                    break
+        if candidates:
+            return candidates[min(candidates)]
+    except (OSError, psutil.Error):
+        pass
+    return "No Connection"
+
+@ttl_cache(DISK_USAGE_MAX_AGE)
+def get_disk_percent():
+    """
+    Get the root filesystem usage percentage.
+
+    Root filesystem usage shifts slowly, so results are reused if they
+    are less than DISK_USAGE_MAX_AGE seconds old.
+
+    Returns:
+        str: Usage formatted for display, or "N/A"
+    """
+    # Get disk usage percentage for root filesystem
+    try:
+        disk = psutil.disk_usage('/')
+        disk_pct = f"{(disk.used / disk.total) * 100:.1f}%"
+    except (OSError, psutil.Error, ZeroDivisionError):
+        disk_pct = "N/A"
+    return disk_pct
+
+@ttl_cache(SYSTEM_DATA_MAX_AGE)
 def get_system_data():
     """
     Retrieve current system performance metrics.
@@ -473,72 +813,86 @@ def get_system_data():
     Collects real-time data including IP address, CPU usage, RAM usage,
     disk usage, and CPU temperature (converted to Fahrenheit).
 
+    CPU usage is measured since the previous call instead of sleeping
+    for a sample window, so this never blocks the main loop. CPU, RAM and
+    temperature are reused if they are less than SYSTEM_DATA_MAX_AGE
+    seconds old; the IP address and disk usage change far less often and
+    keep their own longer cache lifetimes.
+
+    The thermal zone file is opened once and reread from offset 0 on
+    each refresh.
+
     Returns:
         tuple: (ip_address, cpu_percent, ram_percent, disk_percent, temperature)
                All values are formatted as strings for display
     """
-    # Get IP address by connecting to external DNS
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))  # Connect to Google DNS
-        ip = s.getsockname()[0]      # Get local IP used for connection
-        s.close()
-    except:
-        ip = "No Connection"
+    global thermal_fd
+
+    ip = get_ip_address()
 
     # Get CPU usage percentage
     try:
-        cpu = f"{psutil.cpu_percent(interval=0.1):.1f}%"
-    except:
+        cpu = f"{psutil.cpu_percent(interval=None):.1f}%"
+    except (OSError, psutil.Error):
         cpu = "N/A"
 
     # Get RAM usage percentage
     try:
         ram = f"{psutil.virtual_memory().percent:.1f}%"
-    except:
+    except (OSError, psutil.Error):
         ram = "N/A"
 
-    # Get disk usage percentage for root filesystem
-    try:
-        disk = psutil.disk_usage('/')
-        disk_pct = f"{(disk.used / disk.total) * 100:.1f}%"
-    except:
-        disk_pct = "N/A"
+    disk_pct = get_disk_percent()
 
     # Get CPU temperature and convert to Fahrenheit
     try:
-        with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-            temp_celsius = int(f.read()) / 1000.0
-            temp_fahrenheit = (temp_celsius * 9/5) + 32
-            temp_str = f"{temp_fahrenheit:.1f}°F"
-    except:
+        if thermal_fd is None:
+            thermal_fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+        # Millidegrees C to rounded tenths of a degree F, all in integers
+        milli_c = int(os.pread(thermal_fd, 16, 0))
+        f_tenths = (milli_c * 9 + 160000 + 250) // 500
+        temp_str = f"{f_tenths / 10:.1f}°F"
+    except (OSError, ValueError):
         temp_str = "N/A"
 
     return ip, cpu, ram, disk_pct, temp_str
 
+@ttl_cache(INTERFACE_MAX_AGE)
+def get_ethernet_interface():
+    """
+    Find the first ethernet interface that is up.
+
+    Interfaces almost never come and go, so results are reused if they
+    are less than INTERFACE_MAX_AGE seconds old.
+
+    Returns:
+        str: Interface name, or None if no ethernet interface is up
+    """
+    interfaces = psutil.net_if_stats()
+    for interface in interfaces:
+        if interface.startswith('eth') and interfaces[interface].isup:
+            return interface
+    return None
+
+@ttl_cache(NETWORK_INFO_MAX_AGE)
 def get_network_info():
     """
     Retrieve network interface statistics.
 
     Finds the first active ethernet interface and returns its
-    data transmission statistics.
+    data transmission statistics. Results are reused if they are less
+    than NETWORK_INFO_MAX_AGE seconds old.
 
     Returns:
         tuple: (interface_name, bytes_sent_mb, bytes_received_mb)
                All values formatted as strings for display
     """
     try:
-        interfaces = psutil.net_if_stats()
-        net_io = psutil.net_io_counters(pernic=True)
-
-        # Find first active ethernet interface
-        eth_interface = None
-        for interface in interfaces:
-            if interface.startswith('eth') and interfaces[interface].isup:
-                eth_interface = interface
-                break
+        # Find first active ethernet interface (cached), then read only the counters
+        eth_interface = get_ethernet_interface()
+        net_io = psutil.net_io_counters(pernic=True) if eth_interface else {}
 
-        if eth_interface and eth_interface in net_io:
+        if eth_interface in net_io:
             stats = net_io[eth_interface]
             sent_mb = stats.bytes_sent / (1024 * 1024)    # Convert to MB
             recv_mb = stats.bytes_recv / (1024 * 1024)    # Convert to MB
@@ -548,46 +902,54 @@ def get_network_info():
     except:
         return "Error", "N/A", "N/A"
 
+@ttl_cache(TOP_PROCESSES_MAX_AGE)
 def get_top_processes():
     """
     Get the top 5 processes by memory usage from all users, with username display.
 
     Uses RSS (Resident Set Size) memory and includes processes
-    from all users, showing username for clarity.
+    from all users, showing username for clarity. Walking every process
+    is expensive, so results are reused if they are less than
+    TOP_PROCESSES_MAX_AGE seconds old.
 
     Returns:
-        list: List of tuples (process_display_name, memory_percent)
+        list: List of tuples (process_display_name, memory_tenths), where
+              memory_tenths is the share of RAM in tenths of a percent (int).
               Limited to top 5 processes from all users
     """
     try:
         processes = []
         total_memory = psutil.virtual_memory().total
+        rss_floor = total_memory // 2000  # 0.05% of RAM, compared in bytes
 
-        # Get all processes with detailed memory and user info
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'username']):
+        # Walk all processes, reading each one's /proc files once via oneshot()
+        for proc in psutil.process_iter():
             try:
-                # Get memory info
-                memory_info = proc.info['memory_info']
-                if memory_info is None:
-                    continue
+                with proc.oneshot():
+                    rss_bytes = proc.memory_info().rss  # Resident Set Size
+
+                    # Skip processes at or below 0.05% of RAM; they can't make the top 5
+                    if rss_bytes <= rss_floor:
+                        continue
 
-                # Calculate RSS memory percentage (matches 'top' better)
-                rss_bytes = memory_info.rss  # Resident Set Size
-                memory_percent = (rss_bytes / total_memory) * 100
+                    # RSS memory share in rounded tenths of a percent (matches 'top' better)
+                    memory_tenths = (rss_bytes * 1000 + total_memory // 2) // total_memory
 
-                # Include even smaller processes to match 'top' behavior
-                if memory_percent > 0.05:  # Lower threshold to catch more processes
-                    process_name = proc.info['name'] or f"PID-{proc.info['pid']}"
-                    username = proc.info['username'] or "unknown"
+                    # Only look up name and owner for processes that made the cut
+                    process_name = proc.name() or f"PID-{proc.pid}"
+                    try:
+                        username = proc.username() or "unknown"
+                    except psutil.AccessDenied:
+                        username = "unknown"
 
-                    # Create display name with user info for clarity
-                    if username == "root":
-                        display_name = process_name  # Just show process name for root
-                    else:
-                        # Keep full names for better display formatting
-                        display_name = f"{username}:{process_name}"
+                # Create display name with user info for clarity
+                if username == "root":
+                    display_name = process_name  # Just show process name for root
+                else:
+                    # Keep full names for better display formatting
+                    display_name = f"{username}:{process_name}"
 
-                    processes.append((display_name, memory_percent))
+                processes.append((display_name, memory_tenths))
 
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 # Skip processes we can't access
@@ -596,25 +958,28 @@ def get_top_processes():
                 # Skip any other errors
                 continue
 
-        # Sort by memory usage (descending) and return top 5
-        processes.sort(key=lambda x: x[1], reverse=True)
-        return processes[:5]
+        # Return the top 5 by memory usage (descending) without sorting them all
+        return heapq.nlargest(5, processes, key=lambda x: x[1])
 
     except Exception as e:
-        print(f"Error getting processes: {e}")
+        log.warning("Error getting processes: %s", e)
         return [("Error", 0)]
 
-def get_auto_cycle_status():
+def get_auto_cycle_status(current_time):
     """
-    Get auto-cycle status information for display.
+    Get auto-cycle status information for display and cycling.
+
+    Cheap to compute, so each caller (the auto_cycle() and refresh_page()
+    tasks, and the page-change branch of the main loop) asks for it at
+    the moment it needs it and passes it on to check_auto_cycle() or
+    show_page().
+
+    Args:
+        current_time (float): Current time from time.monotonic()
 
     Returns:
         tuple: (is_auto_cycling, time_until_next_cycle)
     """
-    global last_auto_cycle_time, last_manual_interaction, manual_override_duration
-
-    current_time = time.time()
-
     # Check if we're in manual override period
     time_since_manual = current_time - last_manual_interaction
     is_in_manual_override = time_since_manual < manual_override_duration
@@ -628,126 +993,348 @@ def get_auto_cycle_status():
         time_until_next = AUTO_CYCLE_INTERVAL - time_since_last_cycle
         return True, max(0, time_until_next)
 
-def create_page(page_num):
+def create_page_background(page_num):
     """
-    Create a page image with system information and auto-cycle status.
+    Render the parts of a page that never change.
 
-    Generates different pages based on page number:
-    - Page 0: System information (IP, CPU, RAM, Disk, Temperature)
-    - Page 1: Network information (Interface, Sent/Received data)
-    - Page 2: Root processes by memory usage
-
-    Each page has a unique color-coded title, consistent navigation instructions,
-    and auto-cycle status indicator.
+    Each page has a unique color-coded title, consistent navigation
+    instructions and a page indicator. These are rendered once per page
+    so refreshes don't re-rasterize them.
 
     Args:
-        page_num (int): Page number to create (0, 1, or 2)
+        page_num (int): Page number to render (0, 1, or 2)
 
     Returns:
-        PIL.Image: Generated page image ready for display
+        PIL.Image: Page background with static text only
     """
     # Create blank image with black background
     image = Image.new("RGB", (WIDTH, HEIGHT), BLACK)
     draw = ImageDraw.Draw(image)
 
-    # Get auto-cycle status
-    is_auto_cycling, time_remaining = get_auto_cycle_status()
+    if page_num == 0:
+        # Title with bright yellow color for easy identification
+        draw.text((10, 8), TITLE_SYSTEM, font=font_title, fill=BRIGHT_YELLOW)
+    elif page_num == 1:
+        # Title with bright blue color
+        draw.text((10, 8), TITLE_NETWORK, font=font_title, fill=BRIGHT_BLUE)
+    else:
+        # Title with bright orange color and slightly smaller font (21pt instead of 22pt)
+        draw.text((10, 8), TITLE_PROCESSES, font=font_title_small, fill=BRIGHT_ORANGE)
+
+    # Navigation instructions at bottom
+    draw.text((10, 180), NAV_TOP, font=font, fill=GREEN)
+    draw.text((10, 205), NAV_BOTTOM, font=font, fill=GREEN)
+
+    # Page indicator in top-right corner
+    draw.text((WIDTH-25, 10), f"P{page_num}", font=font_title, fill=RED)
+
+    return image
+
+def get_page_background(page_num):
+    """
+    Get the static background for a page, rendering it on first use.
+
+    Args:
+        page_num (int): Page number (0, 1, or 2)
+
+    Returns:
+        PIL.Image: Cached page background (do not draw on it; copy first)
+    """
+    background = page_backgrounds.get(page_num)
+    if background is None:
+        background = page_backgrounds[page_num] = create_page_background(page_num)
+    return background
+
+def get_page_lines(page_num, status):
+    """
+    Collect the live text shown on a page.
 
+    Generates different content based on page number:
+    - Page 0: System information (IP, CPU, RAM, Disk, Temperature)
+    - Page 1: Network information (Interface, Sent/Received data)
+    - Page 2: Root processes by memory usage
+
+    Args:
+        page_num (int): Page number (0, 1, or 2)
+        status (tuple): (is_auto_cycling, time_remaining) from get_auto_cycle_status()
+
+    Returns:
+        tuple: Value lines drawn from the top of the page, followed by the
+               auto-cycle status line
+    """
     if page_num == 0:
         # Page 0: System Information
         # =========================
         ip, cpu, ram, disk, temp = get_system_data()
-
-        # Title with bright yellow color for easy identification
-        draw.text((10, 8), "-- SYSTEM INFO --", font=font_title, fill=BRIGHT_YELLOW)
-
-        # System metrics with consistent spacing
-        draw.text((10, 35), f"IP: {ip}", font=font, fill=WHITE)
-        draw.text((10, 55), f"CPU: {cpu}", font=font, fill=WHITE)
-        draw.text((10, 75), f"RAM: {ram}", font=font, fill=WHITE)
-        draw.text((10, 95), f"Disk: {disk}", font=font, fill=WHITE)
-        draw.text((10, 115), f"Temp: {temp}", font=font, fill=WHITE)
-
-        # Auto-cycle status
-        if is_auto_cycling:
-            mins, secs = divmod(int(time_remaining), 60)
-            draw.text((10, 140), f"Auto: {mins}:{secs:02d}", font=font_small, fill=PURPLE)
-        else:
-            override_remaining = int(time_remaining)
-            draw.text((10, 140), f"Manual: {override_remaining}s", font=font_small, fill=PURPLE)
-
-        # Navigation instructions at bottom
-        draw.text((10, 180), "Top: Next ->", font=font, fill=GREEN)
-        draw.text((10, 205), "Bottom: <- Prev", font=font, fill=GREEN)
+        lines = (LBL_IP + ip, LBL_CPU + cpu, LBL_RAM + ram, LBL_DISK + disk, LBL_TEMP + temp)
 
     elif page_num == 1:
         # Page 1: Network Information
         # ===========================
         interface, sent, recv = get_network_info()
+        lines = (LBL_INTERFACE + interface, LBL_SENT + sent, LBL_RECEIVED + recv)
 
-        # Title with bright blue color
-        draw.text((10, 8), "-- NETWORK INFO --", font=font_title, fill=BRIGHT_BLUE)
+    else:
+        # Page 2: Top Processes
+        # =====================
+        processes = get_top_processes()
+        lines = tuple(f"{i+1}. {name} {mem // 10}.{mem % 10}%" for i, (name, mem) in enumerate(processes))
 
-        # Network statistics
-        draw.text((10, 35), f"Interface: {interface}", font=font, fill=WHITE)
-        draw.text((10, 55), f"Sent: {sent}", font=font, fill=WHITE)
-        draw.text((10, 75), f"Received: {recv}", font=font, fill=WHITE)
+    # Auto-cycle status
+    is_auto_cycling, time_remaining = status
+    if is_auto_cycling:
+        status = AUTO_STRS[int(time_remaining)]
+    else:
+        status = f"Manual: {int(time_remaining)}s"
 
-        # Auto-cycle status
-        if is_auto_cycling:
-            mins, secs = divmod(int(time_remaining), 60)
-            draw.text((10, 100), f"Auto: {mins}:{secs:02d}", font=font_small, fill=PURPLE)
-        else:
-            override_remaining = int(time_remaining)
-            draw.text((10, 100), f"Manual: {override_remaining}s", font=font_small, fill=PURPLE)
+    return lines + (status,)
 
-        # Navigation instructions
-        draw.text((10, 180), "Top: Next ->", font=font, fill=GREEN)
-        draw.text((10, 205), "Bottom: <- Prev", font=font, fill=GREEN)
+def create_page(page_num, lines=None):
+    """
+    Create a page image with system information and auto-cycle status.
 
-    # Page indicator in top-right corner
-    draw.text((WIDTH-25, 10), f"P{page_num}", font=font_title, fill=RED)
+    Starts from the page's prerendered background (title, navigation
+    instructions, page indicator) and draws only the live values and
+    auto-cycle status on top.
+
+    Pages are drawn into two preallocated canvases used alternately, so
+    no image is allocated per refresh and the previously returned page
+    stays intact until the call after next.
+
+    Args:
+        page_num (int): Page number to create (0, 1, or 2)
+        lines (tuple): Text from get_page_lines(); collected if not given
+
+    Returns:
+        PIL.Image: Generated page image ready for display
+    """
+    global next_page_image
+
+    if lines is None:
+        lines = get_page_lines(page_num, get_auto_cycle_status(time.monotonic()))
+
+    # Reset the next canvas to the static page chrome
+    image = page_images[next_page_image]
+    next_page_image ^= 1
+    image.paste(get_page_background(page_num))
+    draw = ImageDraw.Draw(image)
+
+    # Live values with consistent 20px spacing, laid out in one call
+    draw.multiline_text((10, 35), "\n".join(lines[:-1]), font=font, fill=WHITE,
+                        spacing=value_line_spacing)
+
+    # Auto-cycle status (positioned after the values)
+    draw.text((10, STATUS_Y[page_num]), lines[-1], font=font_small, fill=PURPLE)
 
     return image
 
-def check_auto_cycle():
+def show_page(page_num, status):
+    """
+    Render a page and push it to the display if its text has changed.
+
+    Skips drawing, conversion and the SPI transfer entirely when the page
+    would look exactly like the one already on screen.
+
+    Args:
+        page_num (int): Page number to show (0, 1, or 2)
+        status (tuple): (is_auto_cycling, time_remaining) from get_auto_cycle_status()
+
+    Returns:
+        bool: True if a new frame was pushed, False if it was unchanged
+    """
+    global shown_page_key
+
+    lines = get_page_lines(page_num, status)
+    key = (page_num, lines)
+    if key == shown_page_key:
+        return False
+
+    display_image_corrected(create_page(page_num, lines))
+    shown_page_key = key
+    return True
+
+def check_auto_cycle(status, current_time):
     """
     Check if it's time to auto-cycle to the next page.
 
+    Args:
+        status (tuple): (is_auto_cycling, time_remaining) from get_auto_cycle_status()
+        current_time (float): Time the status was computed for
+
     Returns:
         bool: True if auto-cycle should occur, False otherwise
     """
-    global last_auto_cycle_time, last_manual_interaction, current_page
+    global last_auto_cycle_time, current_page
 
-    current_time = time.time()
+    is_auto_cycling, time_remaining = status
 
-    # Check if we're in manual override period
-    time_since_manual = current_time - last_manual_interaction
-    is_in_manual_override = time_since_manual < manual_override_duration
-
-    if is_in_manual_override:
-        # Don't auto-cycle during manual override
+    # Don't auto-cycle during manual override
+    if not is_auto_cycling or time_remaining > 0:
         return False
 
-    # Check if it's time for auto-cycle
-    time_since_last_cycle = current_time - last_auto_cycle_time
+    # Time to auto-cycle
+    current_page = (current_page + 1) % 3  # Cycle to next page
+    last_auto_cycle_time = current_time
+    log.debug("Auto-cycled to page %d", current_page)
+    return True
 
-    if time_since_last_cycle >= AUTO_CYCLE_INTERVAL:
-        # Time to auto-cycle
-        current_page = (current_page + 1) % 3  # Cycle to next page
-        last_auto_cycle_time = current_time
-        print(f"Auto-cycled to page {current_page}")
-        return True
+def get_next_auto_cycle_time():
+    """
+    Get the earliest time the next auto-cycle could happen.
+
+    Returns:
+        float: Monotonic time when the auto-cycle timer and any manual
+               override have both run out
+    """
+    return max(last_auto_cycle_time + AUTO_CYCLE_INTERVAL,
+               last_manual_interaction + manual_override_duration)
+
+def refresh_page(current_time):
+    """
+    Scheduled task: redraw the current page with fresh data.
+
+    Args:
+        current_time (float): Monotonic time the task is run at
+
+    Returns:
+        float: Monotonic time the task is due again
+    """
+    # Nothing is drawn or sent if none of the page's text changed
+    show_page(current_page, get_auto_cycle_status(current_time))
+    return current_time + PAGE_REFRESH_INTERVALS[current_page]
+
+def auto_cycle(current_time):
+    """
+    Scheduled task: move to the next page if the auto-cycle timer is up.
+
+    Args:
+        current_time (float): Monotonic time the task is run at
+
+    Returns:
+        float: Monotonic time the task is due again
+    """
+    check_auto_cycle(get_auto_cycle_status(current_time), current_time)
+    return get_next_auto_cycle_time()
+
+def build_schedule(current_time):
+    """
+    Build the deadline heap for the page that was just drawn.
+
+    Each entry is (deadline, order, task); order breaks ties so the
+    auto-cycle runs before a refresh that falls due at the same time.
+
+    Args:
+        current_time (float): Monotonic time the page was drawn
+
+    Returns:
+        list: Heap of scheduled tasks for heapq
+    """
+    schedule = [(get_next_auto_cycle_time(), 0, auto_cycle),
+                (current_time + PAGE_REFRESH_INTERVALS[current_page], 1, refresh_page)]
+    heapq.heapify(schedule)
+    return schedule
+
+def button_step(pin, edge_ns):
+    """
+    Debounce a button press and map it to a page step.
+
+    Presses whose edge happened within BUTTON_DEBOUNCE_NS of the last
+    accepted press on the same pin are treated as contact bounce. Edge
+    times must come from when the edge happened, not when it was read,
+    so bounces that sat in the queue while the main loop was busy are
+    still recognised.
+
+    Args:
+        pin (int): GPIO pin of the pressed button
+        edge_ns (int): Time of the edge in nanoseconds (one clock per button path)
 
-    return False
+    Returns:
+        int: -1 (bottom button, previous page), +1 (top button, next page),
+             or 0 if the press was dropped as bounce
+    """
+    if edge_ns - last_press_ns[pin] < BUTTON_DEBOUNCE_NS:
+        return 0
+    last_press_ns[pin] = edge_ns
+    return -1 if pin == BTN_A_PIN else 1
+
+def button_watcher():
+    """
+    Poll the buttons on a background thread and queue page steps.
+
+    Only used with the gpiod v0.x API, which has no edge events: both
+    lines are read with one bulk read at 10Hz and the press edge is
+    detected here. Each accepted press puts its page step on
+    button_events for check_buttons() to apply.
+    """
+    last_a_pressed = False
+    last_b_pressed = False
 
-def check_buttons():
+    while running:
+        try:
+            # Read current button states (active low - pressed = 0)
+            btn_a_value, btn_b_value = button_lines.get_values()
+            btn_a_pressed = btn_a_value == 0  # Bottom button
+            btn_b_pressed = btn_b_value == 0  # Top button
+
+            # Only trigger on press edge (was not pressed, now pressed)
+            for pin, pressed, last_pressed in ((BTN_A_PIN, btn_a_pressed, last_a_pressed),
+                                               (BTN_B_PIN, btn_b_pressed, last_b_pressed)):
+                if pressed and not last_pressed:
+                    step = button_step(pin, time.monotonic_ns())
+                    if step:
+                        button_events.put(step)
+
+            last_a_pressed = btn_a_pressed
+            last_b_pressed = btn_b_pressed
+            time.sleep(0.1)
+        except Exception as e:
+            if running:
+                log.warning("Button error: %s", e)
+                time.sleep(BUTTON_ERROR_RETRY)
+
+def read_button_steps(timeout):
     """
-    Check button states and handle page navigation using gpiod for RPi 5.
+    Wait for button presses and return their page steps.
 
-    Implements debouncing logic to prevent multiple triggers from a single
-    button press. Updates the global current_page variable when buttons
-    are pressed and records manual interaction time.
+    With the v1.x API this waits on the button event fds directly, so the
+    main loop sleeps in the kernel until a press or the timeout. Otherwise
+    it waits on the steps queued by button_watcher().
+
+    Args:
+        timeout (float): Seconds to block waiting for a press
+
+    Returns:
+        list: Page steps (-1/+1) in the order they were pressed
+    """
+    steps = []
+
+    if button_selector is not None:
+        for key, _ in button_selector.select(max(timeout, 0)):
+            line = key.data
+            for event in line.event_read_multiple():
+                # Debounce on the kernel's edge timestamp, not the read time
+                step = button_step(line.offset(), event.sec * 1_000_000_000 + event.nsec)
+                if step:
+                    steps.append(step)
+        return steps
+
+    try:
+        steps.append(button_events.get(timeout=timeout) if timeout > 0 else button_events.get_nowait())
+    except queue.Empty:
+        return steps
+    while True:
+        try:
+            steps.append(button_events.get_nowait())
+        except queue.Empty:
+            return steps
+
+def check_buttons(timeout=0):
+    """
+    Apply queued button presses and handle page navigation.
+
+    Presses are collected by read_button_steps(). Updates the global
+    current_page variable for each press and records manual interaction
+    time.
 
     Button mapping:
     - Bottom button (GPIO 23): Previous page (decrements page number)
@@ -755,51 +1342,33 @@ def check_buttons():
 
     Pages wrap around: 0 -> 1 -> 2 -> 0 (forward) or 0 -> 2 -> 1 -> 0 (backward)
 
+    Args:
+        timeout (float): Seconds to block waiting for a press if none is queued
+
     Returns:
         bool: True if page changed, False otherwise
     """
-    global current_page, last_button_a_state, last_button_b_state, last_manual_interaction, last_auto_cycle_time
+    global current_page, last_manual_interaction, last_auto_cycle_time
 
     if not running:
         return False
 
     try:
-        # Read current button states using gpiod (active low - pressed = 0)
-        btn_a_pressed = btn_a_line.get_value() == 0  # Bottom button
-        btn_b_pressed = btn_b_line.get_value() == 0  # Top button
-
-        page_changed = False
-        current_time = time.time()
-
-        # Check bottom button (GPIO 23) - Previous page
-        # Only trigger on press edge (was not pressed, now pressed)
-        if btn_a_pressed and not last_button_a_state:
-            current_page = (current_page - 1) % 3  # Wrap around: 0->2, 1->0, 2->1
-            last_manual_interaction = current_time
-            last_auto_cycle_time = current_time  # Reset auto-cycle timer
-            print(f"Bottom button pressed! Switched to page {current_page} (manual override)")
-            page_changed = True
-
-        # Check top button (GPIO 24) - Next page
-        # Only trigger on press edge (was not pressed, now pressed)
-        if btn_b_pressed and not last_button_b_state:
-            current_page = (current_page + 1) % 3  # Wrap around: 0->1, 1->2, 2->0
-            last_manual_interaction = current_time
-            last_auto_cycle_time = current_time  # Reset auto-cycle timer
-            print(f"Top button pressed! Switched to page {current_page} (manual override)")
-            page_changed = True
-
-        # Update button states for next iteration (debouncing)
-        last_button_a_state = btn_a_pressed
-        last_button_b_state = btn_b_pressed
-
-        return page_changed
-
+        steps = read_button_steps(timeout)
     except Exception as e:
-        if running:
-            print(f"Button error: {e}")
+        log.warning("Button error: %s", e)
         return False
 
+    for step in steps:
+        current_page = (current_page + step) % 3  # Wrap around in either direction
+        current_time = time.monotonic()
+        last_manual_interaction = current_time
+        last_auto_cycle_time = current_time  # Reset auto-cycle timer
+        log.debug("%s button pressed! Switched to page %d (manual override)",
+                  "Bottom" if step < 0 else "Top", current_page)
+
+    return bool(steps)
+
 def main():
     """
     Main application loop for Raspberry Pi 5 with auto-cycling functionality.
@@ -812,27 +1381,33 @@ def main():
     - Auto-cycling every 2 minutes (with manual override capability)
     - Graceful shutdown on Ctrl+C
 
-    The main loop runs at 10Hz (100ms intervals) for responsive button handling
-    while updating system data every 1.5-3 seconds and auto-cycling every 2 minutes
-    to balance responsiveness with system load.
+    The main loop keeps the refresh and auto-cycle deadlines in a heap and
+    sleeps until the earliest one is due, woken early by button presses,
+    so it updates system data every 1.5-3 seconds and auto-cycles every 2
+    minutes without polling the buttons.
     """
     global running, last_auto_cycle_time, last_manual_interaction
 
     # Set up signal handler for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
 
+    # Page changes are logged at DEBUG so a service doesn't write on every press
+    logging.basicConfig(level=LOG_LEVEL, format="%(message)s")
+
     print("Mini PiTFT System Monitor - Raspberry Pi 5 Compatible with Auto-Cycling")
     print("=======================================================================")
 
     # Initialize display hardware
-    if not init_display():
+    # Collect the first stats (IP lookup, network counters, process table)
+    # while the display controller is resetting
+    if not init_display([get_system_data, get_network_info, get_top_processes]):
         print("Display initialization failed")
         return
 
     # Initialize timing variables
-    current_time = time.time()
+    current_time = time.monotonic()
     last_auto_cycle_time = current_time
-    last_manual_interaction = 0  # No manual interaction at start
+    last_manual_interaction = float("-inf")  # No manual interaction at start
 
     # Show startup screen with instructions
     print("Showing startup message...")
@@ -841,16 +1416,16 @@ def main():
     draw.text((40, 80), "System Monitor", font=font_title, fill=WHITE)
     draw.text((60, 100), "RPi 5 Ready!", font=font, fill=GREEN)
     draw.text((30, 125), "Auto-Cycling: 2min", font=font_small, fill=PURPLE)
-    draw.text((10, 160), "Top: Next ->", font=font, fill=BLUE)
-    draw.text((10, 180), "Bottom: <- Prev", font=font, fill=BLUE)
+    draw.text((10, 160), NAV_TOP, font=font, fill=BLUE)
+    draw.text((10, 180), NAV_BOTTOM, font=font, fill=BLUE)
     draw.text((10, 205), "Buttons pause auto", font=font_small, fill=PURPLE)
     display_image_corrected(startup_image)
     time.sleep(4)  # Show startup message for 4 seconds
 
     # Display initial page (page 0 - system info)
     print("Displaying initial page...")
-    page_image = create_page(current_page)
-    display_image_corrected(page_image)
+    current_time = time.monotonic()
+    show_page(current_page, get_auto_cycle_status(current_time))
 
     # Print control instructions to console
     print("\nAuto-Cycling Features:")
@@ -869,39 +1444,36 @@ def main():
     print("  GPIO Chip: gpiochip4")
     print("\nPress Ctrl+C to exit")
 
-    last_update = time.time()
+    # Without edge events, poll the buttons in the background so the main loop can block
+    if button_selector is None:
+        threading.Thread(target=button_watcher, daemon=True).start()
+
+    # Deadline heap of (time, order, task); each task returns when it is next due
+    schedule = build_schedule(current_time)
 
     try:
         # Main monitoring loop
         while running:
-            current_time = time.time()
-
-            # Check for manual button presses and update display if page changed
-            manual_page_change = check_buttons()
+            # Sleep until the earliest deadline, waking early on a button press
+            page = current_page
+            manual_page_change = check_buttons(schedule[0][0] - time.monotonic())
+            current_time = time.monotonic()
 
-            # Check for auto-cycle page change (only if no manual change occurred)
-            auto_page_change = False
+            # Run each task that is due once (only if no manual change occurred)
             if not manual_page_change:
-                auto_page_change = check_auto_cycle()
+                due = []
+                while schedule and schedule[0][0] <= current_time:
+                    due.append(heapq.heappop(schedule))
+                for _, order, task in due:
+                    heapq.heappush(schedule, (task(current_time), order, task))
+                    if current_page != page:
+                        break  # Auto-cycled; the schedule is rebuilt below
 
             # Update display if page changed (either manually or automatically)
-            if manual_page_change or auto_page_change:
-                print(f"Updating display for page {current_page}...")
-                page_image = create_page(current_page)
-                display_image_corrected(page_image)
-                time.sleep(0.1)  # Brief pause after page change for debouncing
-
-            # Different refresh rates for different pages
-            refresh_interval = 1.5 if current_page == 2 else 3.0  # Page 2 refreshes faster
-
-            # Update display with fresh data (but not more often than refresh interval)
-            if current_time - last_update >= refresh_interval:
-                page_image = create_page(current_page)
-                display_image_corrected(page_image)
-                last_update = current_time
-
-            # Sleep briefly to prevent excessive CPU usage while maintaining responsiveness
-            time.sleep(0.1)  # 10Hz loop rate
+            if manual_page_change or current_page != page:
+                log.debug("Updating display for page %d...", current_page)
+                show_page(current_page, get_auto_cycle_status(current_time))
+                schedule = build_schedule(current_time)  # The new page is fresh; restart its timers
 
     except KeyboardInterrupt:
         print("\nExiting...")
@@ -918,31 +1490,4 @@ if __name__ == "__main__":
     This block only executes when the script is run as the main program,
     not when imported as a module.
     """
-    main() Next ->", font=font, fill=GREEN)
-        draw.text((10, 205), "Bottom: <- Prev", font=font, fill=GREEN)
-
-    else:
-        # Page 2: Top Processes
-        # =====================
-        processes = get_top_processes()
-
-        # Title with bright orange color and slightly smaller font (21pt instead of 22pt)
-        draw.text((10, 8), "-- TOP PROCESSES --", font=font_title_small, fill=BRIGHT_ORANGE)
-
-        # List top processes with memory usage
-        y = 35
-        for i, (name, mem) in enumerate(processes):
-            # Display process on single line without truncation
-            draw.text((10, y), f"{i+1}. {name} {mem:.1f}%", font=font, fill=WHITE)
-            y += 20  # 20px spacing between process entries
-
-        # Auto-cycle status (positioned after processes)
-        if is_auto_cycling:
-            mins, secs = divmod(int(time_remaining), 60)
-            draw.text((10, 155), f"Auto: {mins}:{secs:02d}", font=font_small, fill=PURPLE)
-        else:
-            override_remaining = int(time_remaining)
-            draw.text((10, 155), f"Manual: {override_remaining}s", font=font_small, fill=PURPLE)
-
-        # Navigation instructions
-        draw.text((10, 180), "Top:
\ No newline at end of file
+    main()
@@ -25,10 +25,17 @@ License: MIT
 """
 
 import time
+import functools
+import heapq
+import math
 import socket
 import psutil
 import signal
 import sys
+import queue
+import threading
+import numpy as np
+from itertools import zip_longest
 from PIL import Image, ImageDraw, ImageFont
 import spidev
 import RPi.GPIO as GPIO
@@ -39,12 +46,23 @@ DC_PIN = 25      # Data/Command pin for SPI display communication
 RST_PIN = 27     # Reset pin for display initialization (changed from 24 to avoid conflict)
 BTN_A_PIN = 23   # Left button (previous page navigation)
 BTN_B_PIN = 24   # Right button (next page navigation)
+BUTTON_BOUNCE_MS = 200  # Ignore further edges on a button for this long after a press
 
 # Display Configuration
 # ====================
 WIDTH = 240      # Display width in pixels
 HEIGHT = 240     # Display height in pixels
-SPI_SPEED = 8000000  # SPI communication speed (8MHz)
+SPI_SPEED = 64000000  # SPI communication speed (64MHz; overclocks the ST7789's ~62.5MHz rating, lower it if you see artifacts)
+SPI_BUFSIZ_PATH = '/sys/module/spidev/parameters/bufsiz'  # Max bytes per spidev transfer
+SPI_DEFAULT_BUFSIZ = 4096  # spidev default when the bufsiz parameter can't be read
+ROW_OFFSET = 80  # First display memory row used by the Mini PiTFT (180° rotation)
+ROW_BYTES = WIDTH * 2  # Bytes per row of RGB565 pixel data
+CASET_FULL = bytes([0x00, 0x00, 0x00, 0xEF])  # Column address arguments: 0 to 239
+
+# Stats Configuration
+# ===================
+IP_ADDRESS_MAX_AGE = 60.0  # Reuse the local IP address younger than this (seconds)
+TOP_PROCESSES_MAX_AGE = 10.0  # Reuse the process list younger than this (seconds)
 
 # Color Definitions
 # ================
@@ -60,13 +78,56 @@ BRIGHT_YELLOW = (255, 255, 0)   # System Info page title
 BRIGHT_BLUE = (0, 150, 255)     # Network Info page title
 BRIGHT_ORANGE = (255, 165, 0)   # Top Processes page title
 
+# Page Labels
+# ===========
+# Static text, prerendered once per page so refreshes only draw the live values
+TITLE_SYSTEM = "-- SYSTEM INFO --"        # Page 0 title
+TITLE_NETWORK = "-- NETWORK INFO --"      # Page 1 title
+TITLE_PROCESSES = "-- TOP PROCESSES --"   # Page 2 title
+NAV_BOTTOM = "Bottom: <- Prev"            # Bottom button hint
+NAV_TOP = "Top: Next ->"                  # Top button hint
+LBL_IP = "IP: "
+LBL_CPU = "CPU: "
+LBL_RAM = "RAM: "
+LBL_DISK = "Disk: "
+LBL_TEMP = "Temp: "
+LBL_INTERFACE = "Interface: "
+LBL_SENT = "Sent: "
+LBL_RECEIVED = "Received: "
+
+# Label rows per page: (y, label); each value is drawn right after its label
+PAGE_LABELS = {
+    0: ((35, LBL_IP), (55, LBL_CPU), (75, LBL_RAM), (95, LBL_DISK), (115, LBL_TEMP)),
+    1: ((35, LBL_INTERFACE), (55, LBL_SENT), (75, LBL_RECEIVED)),
+    2: (),
+}
+
+# Full-screen black frame in RGB565 (built once, reused by every clear)
+BLACK_FRAME = bytes(WIDTH * HEIGHT * 2)
+
 # Global State Variables
 # =====================
 spi = None                      # SPI device handle
+spi_chunk_size = SPI_DEFAULT_BUFSIZ  # Bytes per SPI transfer for pixel data
+frame_buffers = [bytearray(WIDTH * HEIGHT * 2) for _ in range(2)]  # Ping-pong big-endian RGB565 frames
+frame_views = [np.frombuffer(buf, dtype='>u2').reshape(HEIGHT, WIDTH) for buf in frame_buffers]  # Pixel views of frame_buffers
+frame_pixels = [memoryview(buf) for buf in frame_buffers]  # Byte views of frame_buffers for SPI transfers
+frame_buffer_free = [threading.Semaphore(1) for _ in range(2)]  # Held while a buffer is in use
+next_frame_buffer = 0           # Buffer the next frame is converted into
+frame_queue = queue.Queue(maxsize=1)  # Index of the next frame buffer for the display thread
+display_thread = None           # Thread streaming frames over SPI
+rgb565_scratch = np.empty((2, HEIGHT, WIDTH), dtype=np.uint32)  # Reused word planes for the RGB565 pack
+pixel_changed = np.empty((HEIGHT, WIDTH), dtype=bool)  # Reused per-pixel diff against shown_frame
+shown_frame = None              # RGB565 frame currently in display memory (None = unknown)
+window_rows = None              # (first_row, last_row) of the controller's address window (None = unknown)
+page_image = Image.new("RGB", (WIDTH, HEIGHT), BLACK)  # Page canvas, allocated once and redrawn in place
+page_draw = ImageDraw.Draw(page_image)  # Drawer bound to page_image
+page_items = []                 # (xy, text, font, fill) value items currently drawn on page_image
+page_backgrounds = {}           # Static page chrome and labels by page number, rendered on first use
+page_image_num = None           # Page number rendered into page_image (None = nothing yet)
 running = True                  # Main loop control flag
 current_page = 0               # Current displayed page (0=System, 1=Network, 2=Processes)
-last_button_a_state = True     # Previous state of button A (for debouncing)
-last_button_b_state = True     # Previous state of button B (for debouncing)
+button_event = threading.Event()  # Set by the button callbacks when the page changes
 
 def cleanup():
     """
@@ -78,6 +139,10 @@ def cleanup():
     global running
     running = False
     try:
+        # Let the display thread finish its current frame before closing SPI
+        if display_thread and display_thread is not threading.current_thread():
+            queue_frame(None)
+            display_thread.join(timeout=1.0)
         if spi:
             spi.close()
         GPIO.cleanup()
@@ -106,41 +171,88 @@ def write_cmd(cmd):
     if not running:
         return
     GPIO.output(DC_PIN, GPIO.LOW)  # Set DC low for command mode
-    spi.xfer2([cmd])
+    spi.writebytes2(bytes([cmd]))
 
 def write_data(data):
     """
     Send data byte(s) to the display via SPI.
 
+    Everything is sent write-only with writebytes2 as a bytes-like buffer,
+    which spidev reads directly instead of unpacking a list of ints; lists
+    and single ints are packed into bytes first.
+
     Args:
-        data (int or list): Data byte or list of bytes to send
+        data (int, list or bytes-like): Data byte, list of bytes or bytes buffer to send
     """
     if not running:
         return
     GPIO.output(DC_PIN, GPIO.HIGH)  # Set DC high for data mode
-    if isinstance(data, list):
-        spi.xfer2(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        spi.writebytes2(data)
+    elif isinstance(data, list):
+        spi.writebytes2(bytes(data))
     else:
-        spi.xfer2([data])
+        spi.writebytes2(bytes([data]))
 
-def rgb_to_rgb565(r, g, b):
+def write_cmd_data(cmd, data):
     """
-    Convert RGB888 color to RGB565 format for display.
+    Send a command byte followed by its argument bytes.
 
-    The ST7789 display uses 16-bit RGB565 color format:
-    - Red: 5 bits (bits 15-11)
-    - Green: 6 bits (bits 10-5)
-    - Blue: 5 bits (bits 4-0)
+    Toggles DC once for the command and once for the arguments and sends
+    each as a single write-only transfer, instead of going through
+    write_cmd() and write_data() separately.
 
     Args:
-        r (int): Red component (0-255)
-        g (int): Green component (0-255)
-        b (int): Blue component (0-255)
+        cmd (int): Command byte to send (0x00-0xFF)
+        data (bytes-like): Argument bytes for the command
+    """
+    if not running:
+        return
+    GPIO.output(DC_PIN, GPIO.LOW)   # Command byte
+    spi.writebytes2(bytes([cmd]))
+    GPIO.output(DC_PIN, GPIO.HIGH)  # Argument bytes
+    spi.writebytes2(data)
 
-    Returns:
-        int: 16-bit RGB565 color value
+def set_window_rows(first_row, last_row):
+    """
+    Open a full-width memory write window over a range of panel rows.
+
+    The ST7789 keeps its address window between memory writes, so the
+    column/row commands are only sent when the rows differ from the last
+    window set; the memory write command (which restarts at the window's
+    first pixel) is always sent. Leaves DC high so the caller can stream
+    pixel data straight away.
+
+    Args:
+        first_row (int): First panel row to write (0-based)
+        last_row (int): Last panel row to write (inclusive)
+    """
+    global window_rows
+
+    if window_rows != (first_row, last_row):
+        # Columns are always full width, so they only need setting once
+        if window_rows is None:
+            write_cmd_data(0x2A, CASET_FULL)  # Column address: 0 to 239
+        start = first_row + ROW_OFFSET
+        end = last_row + ROW_OFFSET
+        write_cmd_data(0x2B, bytes([start >> 8, start & 0xFF, end >> 8, end & 0xFF]))  # Row address (Mini PiTFT offset)
+        window_rows = (first_row, last_row)
+
+    write_cmd(0x2C)  # Memory write
+    GPIO.output(DC_PIN, GPIO.HIGH)  # Pixel data follows; DC stays high for the whole window
+
+def send_pixels(pixels):
+    """
+    Stream RGB565 pixel data into the open memory write window.
+
+    Args:
+        pixels (memoryview): Big-endian RGB565 bytes to send
     """
-    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+    # Send pixels in transfers as large as spidev allows
+    for i in range(0, len(pixels), spi_chunk_size):
+        if not running:
+            break
+        spi.writebytes2(pixels[i:i + spi_chunk_size])
 
 def clear_display_memory():
     """
@@ -149,26 +261,31 @@ def clear_display_memory():
     Sets the display window to full screen and fills it with black pixels.
     This prevents display artifacts and ensures clean startup.
     """
-    # Set full display area
-    write_cmd(0x2A)  # Column address
-    write_data([0x00, 0x00, 0x00, 0xEF])  # 0 to 239
+    global shown_frame
 
-    write_cmd(0x2B)  # Row address
-    write_data([0x00, 0x50, 0x01, 0x3F])  # 80 to 319 (Mini PiTFT offset)
+    # Send the prebuilt black frame to entire display
+    set_window_rows(0, HEIGHT - 1)
+    send_pixels(memoryview(BLACK_FRAME))
 
-    write_cmd(0x2C)  # Memory write
+    # Display memory is now known to be black, so later frames can be diffed
+    shown_frame = np.zeros((HEIGHT, WIDTH), dtype='>u2')
 
-    # Send black pixels to entire display
-    black_pixel = [0x00, 0x00]  # Black in RGB565 format
-    total_pixels = WIDTH * HEIGHT
+def get_spi_bufsiz():
+    """
+    Read the spidev kernel transfer buffer size.
 
-    # Send pixels in chunks for efficiency
-    chunk_size = 1024
-    for i in range(0, total_pixels * 2, chunk_size):
-        if not running:
-            break
-        chunk = black_pixel * (chunk_size // 2)
-        write_data(chunk)
+    spidev rejects transfers larger than this, so it sets the largest
+    chunk we can push in one ioctl. It defaults to 4096 bytes and can be
+    raised with the spidev.bufsiz=65536 kernel parameter.
+
+    Returns:
+        int: Maximum bytes per SPI transfer
+    """
+    try:
+        with open(SPI_BUFSIZ_PATH, 'r') as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return SPI_DEFAULT_BUFSIZ
 
 def init_display():
     """
@@ -184,7 +301,7 @@ def init_display():
     Returns:
         bool: True if initialization successful, False otherwise
     """
-    global spi
+    global spi, spi_chunk_size, display_thread, window_rows
 
     print("Initializing display with proper memory mapping...")
 
@@ -196,13 +313,18 @@ def init_display():
     GPIO.setup(BTN_A_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)  # Bottom button with pullup
     GPIO.setup(BTN_B_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)  # Top button with pullup
 
+    # Buttons are active low: let the kernel report presses (falling edges)
+    GPIO.add_event_detect(BTN_A_PIN, GPIO.FALLING, callback=on_button_press, bouncetime=BUTTON_BOUNCE_MS)
+    GPIO.add_event_detect(BTN_B_PIN, GPIO.FALLING, callback=on_button_press, bouncetime=BUTTON_BOUNCE_MS)
+
     # Initialize SPI communication
     try:
         spi = spidev.SpiDev()
         spi.open(0, 0)  # SPI bus 0, device 0
-        spi.max_speed_hz = SPI_SPEED
+        spi.max_speed_hz = SPI_SPEED  # Requested rate; the controller clamps and divides it silently
         spi.mode = 0    # SPI mode 0 (CPOL=0, CPHA=0)
-        print(f"SPI initialized at {SPI_SPEED} Hz")
+        spi_chunk_size = get_spi_bufsiz()
+        print(f"SPI initialized at {SPI_SPEED} Hz requested ({spi_chunk_size} byte transfers)")
     except Exception as e:
         print(f"SPI failed: {e}")
         return False
@@ -226,67 +348,53 @@ def init_display():
         time.sleep(0.25)
 
         # Set 180° rotation for proper Mini PiTFT orientation
-        write_cmd(0x36)  # Memory Access Control
-        write_data([0xC0])  # 180° rotation
+        write_cmd_data(0x36, b'\xC0')  # Memory Access Control: 180° rotation
 
         # Set color format to 16-bit RGB565
-        write_cmd(0x3A)  # Interface Pixel Format
-        write_data([0x55])  # 16-bit color
+        write_cmd_data(0x3A, b'\x55')  # Interface Pixel Format: 16-bit color
 
         # Set display area for 1.3" Mini PiTFT with 180° rotation
         # Column address set (X coordinates)
-        write_cmd(0x2A)
-        write_data([0x00, 0x00, 0x00, 0xEF])  # 0 to 239
+        write_cmd_data(0x2A, CASET_FULL)  # 0 to 239
 
         # Row address set (Y coordinates with Mini PiTFT offset)
-        write_cmd(0x2B)
-        write_data([0x00, 0x50, 0x01, 0x3F])  # 80 to 319 (Mini PiTFT specific offset)
+        write_cmd_data(0x2B, b'\x00\x50\x01\x3F')  # 80 to 319 (Mini PiTFT specific offset)
+        window_rows = (0, HEIGHT - 1)
 
         # Porch control
-        write_cmd(0xB2)
-        write_data([0x0C, 0x0C, 0x00, 0x33, 0x33])
+        write_cmd_data(0xB2, b'\x0C\x0C\x00\x33\x33')
 
         # Gate control
-        write_cmd(0xB7)
-        write_data([0x35])
+        write_cmd_data(0xB7, b'\x35')
 
         # VCOM setting
-        write_cmd(0xBB)
-        write_data([0x19])
+        write_cmd_data(0xBB, b'\x19')
 
         # LCM control
-        write_cmd(0xC0)
-        write_data([0x2C])
+        write_cmd_data(0xC0, b'\x2C')
 
         # VDV and VRH command enable
-        write_cmd(0xC2)
-        write_data([0x01])
+        write_cmd_data(0xC2, b'\x01')
 
         # VRH set
-        write_cmd(0xC3)
-        write_data([0x12])
+        write_cmd_data(0xC3, b'\x12')
 
         # VDV set
-        write_cmd(0xC4)
-        write_data([0x20])
+        write_cmd_data(0xC4, b'\x20')
 
         # Frame rate control
-        write_cmd(0xC6)
-        write_data([0x0F])
+        write_cmd_data(0xC6, b'\x0F')
 
         # Power control
-        write_cmd(0xD0)
-        write_data([0xA4, 0xA1])
+        write_cmd_data(0xD0, b'\xA4\xA1')
 
         # Positive voltage gamma control
-        write_cmd(0xE0)
-        write_data([0xD0, 0x04, 0x0D, 0x11, 0x13, 0x2B, 0x3F, 0x54,
-                   0x4C, 0x18, 0x0D, 0x0B, 0x1F, 0x23])
+        write_cmd_data(0xE0, b'\xD0\x04\x0D\x11\x13\x2B\x3F\x54'
+                             b'\x4C\x18\x0D\x0B\x1F\x23')
 
         # Negative voltage gamma control
-        write_cmd(0xE1)
-        write_data([0xD0, 0x04, 0x0C, 0x11, 0x13, 0x2C, 0x3F, 0x44,
-                   0x51, 0x2F, 0x1F, 0x1F, 0x20, 0x23])
+        write_cmd_data(0xE1, b'\xD0\x04\x0C\x11\x13\x2C\x3F\x44'
+                             b'\x51\x2F\x1F\x1F\x20\x23')
 
         # Display inversion on (improves color accuracy)
         write_cmd(0x21)
@@ -302,6 +410,10 @@ def init_display():
         write_cmd(0x29)
         time.sleep(0.1)
 
+        # From here on all pixel data goes through the display thread
+        display_thread = threading.Thread(target=display_worker, daemon=True)
+        display_thread.start()
+
         print("Display initialized with 180° rotation and cleared memory")
         return True
 
@@ -309,52 +421,147 @@ def init_display():
         print(f"Display initialization failed: {e}")
         return False
 
-def display_image_corrected(image):
+def send_frame(index):
     """
-    Display an image on the ST7789 display with proper memory mapping.
+    Send the rows of a frame buffer that differ from display memory.
 
-    Converts PIL Image to RGB565 format and sends to display memory.
-    Handles the Mini PiTFT's specific memory offset and 180° rotation.
+    Only rows that differ from the frame already on the panel are sent;
+    each contiguous run of changed rows gets its own row window. An
+    identical frame sends nothing.
 
     Args:
-        image (PIL.Image): Image to display (will be converted to RGB if needed)
+        index (int): Index into frame_buffers of the frame to send
     """
+    global shown_frame
+
     if not running:
         return
 
-    # Ensure image is in RGB format
-    rgb_image = image.convert('RGB')
-
-    # Set display area with Mini PiTFT offset for 180° rotation
-    write_cmd(0x2A)  # Column address
-    write_data([0x00, 0x00, 0x00, 0xEF])  # 0 to 239
+    frame = frame_views[index]
+    pixels = frame_pixels[index]
 
-    write_cmd(0x2B)  # Row address
-    write_data([0x00, 0x50, 0x01, 0x3F])  # 80 to 319 (Mini PiTFT offset)
+    if shown_frame is None:
+        # Display memory contents unknown: send the whole frame
+        set_window_rows(0, HEIGHT - 1)
+        send_pixels(pixels)
+        shown_frame = frame.copy()
+        return
 
-    write_cmd(0x2C)  # Memory write
+    # Find contiguous runs of changed rows; edges alternate start/end (exclusive)
+    np.not_equal(frame, shown_frame, out=pixel_changed)
+    dirty = pixel_changed.any(axis=1).astype(np.int8)
+    edges = np.flatnonzero(np.diff(dirty, prepend=0, append=0))
 
-    # Convert PIL image pixels to RGB565 format
-    pixels = []
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            if x < rgb_image.width and y < rgb_image.height:
-                r, g, b = rgb_image.getpixel((x, y))
-            else:
-                r, g, b = 0, 0, 0  # Black for areas outside image bounds
-
-            # Convert to RGB565 and split into high/low bytes
-            rgb565 = rgb_to_rgb565(r, g, b)
-            pixels.append((rgb565 >> 8) & 0xFF)  # High byte
-            pixels.append(rgb565 & 0xFF)         # Low byte
-
-    # Send pixel data in chunks for efficiency
-    chunk_size = 1024
-    for i in range(0, len(pixels), chunk_size):
+    for start, end in zip(edges[0::2], edges[1::2]):
         if not running:
+            return
+        set_window_rows(start, end - 1)
+        send_pixels(pixels[start * ROW_BYTES:end * ROW_BYTES])
+        shown_frame[start:end] = frame[start:end]
+
+def display_worker():
+    """
+    Send queued frames to the display on a background thread.
+
+    Runs the SPI transfer of frame N while the main thread gathers stats,
+    renders and converts frame N+1. Exits when it receives None or running
+    is cleared.
+    """
+    global shown_frame, window_rows
+
+    while running:
+        index = frame_queue.get()
+        if index is None:
             break
-        chunk = pixels[i:i + chunk_size]
-        write_data(chunk)
+        try:
+            send_frame(index)
+        except Exception as e:
+            shown_frame = None  # Display memory is unknown; resend the next frame in full
+            window_rows = None  # So is the address window; set it again in full
+            if running:
+                print(f"Display error: {e}")
+        finally:
+            frame_buffer_free[index].release()
+
+def queue_frame(index):
+    """
+    Hand a frame buffer to the display thread, replacing any frame still waiting.
+
+    Only the newest frame matters, so a frame that has not started
+    sending yet is dropped (and its buffer freed) rather than letting
+    updates back up.
+
+    Args:
+        index (int or None): Index into frame_buffers, or None to stop the display thread
+    """
+    try:
+        frame_queue.put_nowait(index)
+    except queue.Full:
+        try:
+            dropped = frame_queue.get_nowait()
+            if dropped is not None:
+                frame_buffer_free[dropped].release()
+        except queue.Empty:
+            pass
+        frame_queue.put_nowait(index)
+
+def display_image_corrected(image):
+    """
+    Display an image on the ST7789 display with proper memory mapping.
+
+    Converts PIL Image to RGB565 format into the free one of two reusable
+    frame buffers and queues it for the display thread, which sends the
+    changed rows to display memory. Handles the Mini PiTFT's specific
+    memory offset and 180° rotation. The image can be reused as soon as
+    this returns.
+
+    Args:
+        image (PIL.Image): Image to display (will be converted to RGB if needed)
+    """
+    global next_frame_buffer
+
+    if not running:
+        return
+
+    # Pages from create_page are already RGB at the panel size and are used
+    # as is; anything else is padded/cropped onto a black panel-sized canvas
+    # (paste converts the mode) so the pixel array is exactly HEIGHT x WIDTH
+    rgb_image = image
+    if rgb_image.size != (WIDTH, HEIGHT):
+        rgb_image = Image.new("RGB", (WIDTH, HEIGHT), BLACK)
+        rgb_image.paste(image)
+    elif rgb_image.mode != 'RGB':
+        rgb_image = rgb_image.convert('RGB')
+
+    # Wait until the display thread is done with the buffer we convert into
+    index = next_frame_buffer
+    while not frame_buffer_free[index].acquire(timeout=0.5):
+        if not running:
+            return
+    next_frame_buffer ^= 1
+
+    # Take the pixels straight from libImaging padded to RGBX, so each one
+    # is a single little-endian word (R in the low byte), and pack all of
+    # them to the ST7789's 16-bit RGB565 format (red in bits 15-11, green
+    # in bits 10-5, blue in bits 4-0) with masks and shifts on whole words.
+    # This reads contiguous memory instead of three byte-strided planes,
+    # and works in place in the scratch planes
+    words = np.frombuffer(rgb_image.tobytes("raw", "RGBX"), dtype='<u4').reshape(HEIGHT, WIDTH)
+    packed, part = rgb565_scratch
+    np.bitwise_and(words, 0xF8, out=packed)        # Red: bits 3-7 ...
+    np.left_shift(packed, 8, out=packed)           # ... to bits 11-15
+    np.bitwise_and(words, 0xFC00, out=part)        # Green: bits 10-15 ...
+    np.right_shift(part, 5, out=part)              # ... to bits 5-10
+    np.bitwise_or(packed, part, out=packed)
+    np.bitwise_and(words, 0xF80000, out=part)      # Blue: bits 19-23 ...
+    np.right_shift(part, 19, out=part)             # ... to bits 0-4
+    np.bitwise_or(packed, part, out=packed)
+
+    # Store big-endian (high byte first, as the ST7789 expects) directly
+    # into the frame buffer
+    frame_views[index][...] = packed
+
+    queue_frame(index)
 
 # Font Configuration
 # ==================
@@ -378,18 +585,94 @@ except:
         font_title_small = ImageFont.load_default()
         print("Using default fonts (UbuntuNerdFont not found)")
 
-def get_system_data():
+# Where each label's value starts: labels are plain text, so drawing the
+# value at the label's advance gives the same pixels as drawing the whole line
+value_x = {label: 10 + font.getlength(label)
+           for labels in PAGE_LABELS.values() for _, label in labels}
+
+TEXT_MASK_CACHE_SIZE = 256  # Rasterized value strings kept by get_text_mask()
+
+@functools.lru_cache(maxsize=TEXT_MASK_CACHE_SIZE)
+def get_text_mask(text, fnt, start):
     """
-    Retrieve current system performance metrics.
+    Rasterize a string into an alpha mask, once per (text, font, start).
 
-    Collects real-time data including IP address, CPU usage, RAM usage,
-    disk usage, and CPU temperature (converted to Fahrenheit).
+    Values such as "12.5%" or "eth0" come back on most refreshes, so
+    FreeType only has to lay out and anti-alias each distinct string once.
+
+    Args:
+        text (str): Text to rasterize
+        fnt (ImageFont.FreeTypeFont): Font to draw with
+        start (tuple): Fractional (x, y) part of the drawing position
 
     Returns:
-        tuple: (ip_address, cpu_percent, ram_percent, disk_percent, temperature)
-               All values are formatted as strings for display
+        tuple: (mask, (dx, dy)) "L" mask and its offset from the whole-pixel position
+    """
+    x0, y0, x1, y1 = page_draw.textbbox(start, text, font=fnt)
+    dx, dy = math.floor(x0), math.floor(y0)
+    mask = Image.new("L", (max(math.ceil(x1) - dx, 1), max(math.ceil(y1) - dy, 1)), 0)
+    ImageDraw.Draw(mask).text((start[0] - dx, start[1] - dy), text, font=fnt, fill=255)
+    return mask, (dx, dy)
+
+def draw_text(image, xy, text, fnt, fill):
+    """
+    Draw text like ImageDraw.text, reusing cached masks from get_text_mask().
+
+    Filling through the mask blends exactly as ImageDraw.text does, so the
+    pixels are identical.
+
+    Args:
+        image (PIL.Image): RGB image to draw on
+        xy (tuple): (x, y) text position, may be fractional
+        text (str): Text to draw
+        fnt (ImageFont.FreeTypeFont): Font to draw with
+        fill (tuple): RGB text color
+    """
+    x, y = math.floor(xy[0]), math.floor(xy[1])
+    mask, (dx, dy) = get_text_mask(text, fnt, (xy[0] - x, xy[1] - y))
+    image.paste(fill, (x + dx, y + dy), mask)
+
+# Prime CPU usage sampling: the first non-blocking call has no baseline
+psutil.cpu_percent(interval=None)
+
+def ttl_cache(seconds):
+    """
+    Decorator that reuses a function's result for a fixed number of seconds.
+
+    Args:
+        seconds (float): How long a result stays valid
+
+    Returns:
+        function: Decorator wrapping a function that takes no arguments
+    """
+    def decorator(func):
+        cache = {}  # "entry" -> (monotonic timestamp, value)
+
+        @functools.wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            entry = cache.get("entry")
+            if entry is not None and now - entry[0] < seconds:
+                return entry[1]
+            value = func()
+            cache["entry"] = (now, value)
+            return value
+
+        return wrapper
+    return decorator
+
+@ttl_cache(IP_ADDRESS_MAX_AGE)
+def get_ip_address():
+    """
+    Look up the local IP address used for outgoing traffic.
+
+    Connecting a UDP socket sends no packets but makes the kernel pick a
+    route and source address. The address rarely changes, so results are
+    reused if they are less than IP_ADDRESS_MAX_AGE seconds old.
+
+    Returns:
+        str: Local IP address, or "No Connection"
     """
-    # Get IP address by connecting to external DNS
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))  # Connect to Google DNS
@@ -397,10 +680,25 @@ def get_system_data():
         s.close()
     except:
         ip = "No Connection"
+    return ip
+
+def get_system_data():
+    """
+    Retrieve current system performance metrics.
 
-    # Get CPU usage percentage
+    Collects real-time data including IP address, CPU usage, RAM usage,
+    disk usage, and CPU temperature (converted to Fahrenheit).
+
+    Returns:
+        tuple: (ip_address, cpu_percent, ram_percent, disk_percent, temperature)
+               All values are formatted as strings for display
+    """
+    # Get IP address (cached, see get_ip_address)
+    ip = get_ip_address()
+
+    # Get CPU usage percentage since the previous call (non-blocking)
     try:
-        cpu = f"{psutil.cpu_percent(interval=0.1):.1f}%"
+        cpu = f"{psutil.cpu_percent(interval=None):.1f}%"
     except:
         cpu = "N/A"
 
@@ -460,167 +758,227 @@ def get_network_info():
     except:
         return "Error", "N/A", "N/A"
 
+@ttl_cache(TOP_PROCESSES_MAX_AGE)
 def get_top_processes():
     """
     Get the top 5 processes by memory usage.
 
-    Iterates through all running processes and sorts them by
-    memory percentage to find the highest consumers.
+    Iterates through all running processes and keeps the five highest
+    memory consumers with a bounded heap instead of sorting the whole
+    list. Rankings barely move between refreshes, so results are reused
+    if they are less than TOP_PROCESSES_MAX_AGE seconds old.
 
     Returns:
         list: List of tuples (process_name, memory_percent)
               Limited to top 5 processes
     """
     try:
-        processes = []
-        for proc in psutil.process_iter(['name', 'memory_percent']):
-            try:
-                if proc.info['memory_percent'] > 0:
-                    processes.append((proc.info['name'], proc.info['memory_percent']))
-            except:
-                continue  # Skip processes that can't be accessed
-
-        # Sort by memory usage (descending) and return top 5
-        processes.sort(key=lambda x: x[1], reverse=True)
-        return processes[:5]
+        # Processes that can't be accessed report None and are skipped
+        processes = ((proc.info['name'], proc.info['memory_percent'])
+                     for proc in psutil.process_iter(['name', 'memory_percent'])
+                     if proc.info['memory_percent'])
+
+        return heapq.nlargest(5, processes, key=lambda x: x[1])
     except:
         return [("Error", 0)]
 
-def create_page(page_num):
+def create_page_background(page_num):
     """
-    Create a page image with system information.
-
-    Generates different pages based on page number:
-    - Page 0: System information (IP, CPU, RAM, Disk, Temperature)
-    - Page 1: Network information (Interface, Sent/Received data)
-    - Page 2: Top processes by memory usage
+    Render the parts of a page that never change.
 
-    Each page has a unique color-coded title and consistent navigation instructions.
+    Each page has a unique color-coded title, its value labels, consistent
+    navigation instructions and a page indicator. These are rendered once
+    per page so refreshes don't re-rasterize them.
 
     Args:
-        page_num (int): Page number to create (0, 1, or 2)
+        page_num (int): Page number to render (0, 1, or 2)
 
     Returns:
-        PIL.Image: Generated page image ready for display
+        PIL.Image: Page background with static text only
     """
     # Create blank image with black background
     image = Image.new("RGB", (WIDTH, HEIGHT), BLACK)
     draw = ImageDraw.Draw(image)
 
     if page_num == 0:
-        # Page 0: System Information
-        # =========================
-        ip, cpu, ram, disk, temp = get_system_data()
-
         # Title with bright yellow color for easy identification
-        draw.text((10, 8), "-- SYSTEM INFO --", font=font_title, fill=BRIGHT_YELLOW)
+        draw.text((10, 8), TITLE_SYSTEM, font=font_title, fill=BRIGHT_YELLOW)
+    elif page_num == 1:
+        # Title with bright blue color
+        draw.text((10, 8), TITLE_NETWORK, font=font_title, fill=BRIGHT_BLUE)
+    else:
+        # Title with bright orange color and slightly smaller font (21pt instead of 22pt)
+        draw.text((10, 8), TITLE_PROCESSES, font=font_title_small, fill=BRIGHT_ORANGE)
 
-        # System metrics with consistent spacing
-        draw.text((10, 35), f"IP: {ip}", font=font, fill=WHITE)
-        draw.text((10, 55), f"CPU: {cpu}", font=font, fill=WHITE)
-        draw.text((10, 75), f"RAM: {ram}", font=font, fill=WHITE)
-        draw.text((10, 95), f"Disk: {disk}", font=font, fill=WHITE)
-        draw.text((10, 115), f"Temp: {temp}", font=font, fill=WHITE)
+    # Value labels with consistent spacing
+    for y, label in PAGE_LABELS[page_num]:
+        draw.text((10, y), label, font=font, fill=WHITE)
 
-        # Navigation instructions at bottom
-        draw.text((10, 180), "Bottom: <- Prev", font=font, fill=GREEN)
-        draw.text((10, 205), "Top: Next ->", font=font, fill=GREEN)
+    # Navigation instructions at bottom
+    draw.text((10, 180), NAV_BOTTOM, font=font, fill=GREEN)
+    draw.text((10, 205), NAV_TOP, font=font, fill=GREEN)
 
-    elif page_num == 1:
-        # Page 1: Network Information
-        # ===========================
-        interface, sent, recv = get_network_info()
+    # Page indicator in top-right corner
+    draw.text((WIDTH-25, 10), f"P{page_num}", font=font_title, fill=RED)
 
-        # Title with bright blue color
-        draw.text((10, 8), "-- NETWORK INFO --", font=font_title, fill=BRIGHT_BLUE)
+    return image
+
+def get_page_background(page_num):
+    """
+    Get the static background for a page, rendering it on first use.
+
+    Args:
+        page_num (int): Page number (0, 1, or 2)
 
-        # Network statistics
-        draw.text((10, 35), f"Interface: {interface}", font=font, fill=WHITE)
-        draw.text((10, 55), f"Sent: {sent}", font=font, fill=WHITE)
-        draw.text((10, 75), f"Received: {recv}", font=font, fill=WHITE)
+    Returns:
+        PIL.Image: Cached page background (do not draw on it; copy first)
+    """
+    background = page_backgrounds.get(page_num)
+    if background is None:
+        background = page_backgrounds[page_num] = create_page_background(page_num)
+    return background
+
+def get_page_items(page_num):
+    """
+    Build the live text items that are drawn over a page's background.
+
+    Generates different pages based on page number:
+    - Page 0: System information (IP, CPU, RAM, Disk, Temperature)
+    - Page 1: Network information (Interface, Sent/Received data)
+    - Page 2: Top processes by memory usage
 
-        # Navigation instructions
-        draw.text((10, 180), "Bottom: <- Prev", font=font, fill=GREEN)
-        draw.text((10, 205), "Top: Next ->", font=font, fill=GREEN)
+    Args:
+        page_num (int): Page number to build (0, 1, or 2)
+
+    Returns:
+        list: (xy, text, font, fill) tuples in drawing order
+    """
+    if page_num == 0:
+        # Page 0: System Information
+        # =========================
+        values = get_system_data()
+
+    elif page_num == 1:
+        # Page 1: Network Information
+        # ===========================
+        values = get_network_info()
 
     else:
         # Page 2: Top Processes
         # =====================
         processes = get_top_processes()
 
-        # Title with bright orange color and slightly smaller font (21pt instead of 22pt)
-        draw.text((10, 8), "-- TOP PROCESSES --", font=font_title_small, fill=BRIGHT_ORANGE)
-
         # List top processes with memory usage
+        items = []
         y = 35
         for i, (name, mem) in enumerate(processes):
             # Truncate long process names to fit display
             short_name = name[:10] if len(name) > 10 else name
-            draw.text((10, y), f"{i+1}. {short_name} {mem:.1f}%", font=font, fill=WHITE)
+            items.append(((10, y), f"{i+1}. {short_name} {mem:.1f}%", font, WHITE))
             y += 20  # 20px spacing between process entries
+        return items
 
-        # Navigation instructions
-        draw.text((10, 180), "Bottom: <- Prev", font=font, fill=GREEN)
-        draw.text((10, 205), "Top: Next ->", font=font, fill=GREEN)
+    # Each value goes right after its prerendered label
+    return [((value_x[label], y), value, font, WHITE)
+            for (y, label), value in zip(PAGE_LABELS[page_num], values)]
 
-    # Page indicator in top-right corner
-    draw.text((WIDTH-25, 10), f"P{page_num}", font=font_title, fill=RED)
+def redraw_box(box, items, background):
+    """
+    Redraw one rectangle of the page image from scratch.
 
-    return image
+    The box is rendered onto a tile cut from the page background with
+    every item that overlaps it, then pasted back, so pixels outside the
+    box are untouched and anti-aliased edges are never blended twice.
 
-def check_buttons():
+    Args:
+        box (tuple): (x0, y0, x1, y1) rectangle to redraw, end exclusive
+        items (list): (xy, text, font, fill) items of the current page
+        background (PIL.Image): Static background of the current page
     """
-    Check button states and handle page navigation.
+    # Values can start at fractional x, so round the box outwards to whole pixels
+    x0, y0 = max(math.floor(box[0]), 0), max(math.floor(box[1]), 0)
+    x1, y1 = min(math.ceil(box[2]), WIDTH), min(math.ceil(box[3]), HEIGHT)
+    if x1 <= x0 or y1 <= y0:
+        return
 
-    Implements debouncing logic to prevent multiple triggers from a single
-    button press. Updates the global current_page variable when buttons
-    are pressed.
+    tile = background.crop((x0, y0, x1, y1))
+    for (x, y), text, fnt, fill in items:
+        ix0, iy0, ix1, iy1 = page_draw.textbbox((x, y), text, font=fnt)
+        if ix0 < x1 and ix1 > x0 and iy0 < y1 and iy1 > y0:
+            draw_text(tile, (x - x0, y - y0), text, fnt, fill)
+    page_image.paste(tile, (x0, y0))
 
-    Button mapping:
-    - Bottom button (GPIO 23): Previous page (decrements page number)
-    - Top button (GPIO 24): Next page (increments page number)
+def create_page(page_num):
+    """
+    Create a page image with system information.
 
-    Pages wrap around: 0 -> 1 -> 2 -> 0 (forward) or 0 -> 2 -> 1 -> 0 (backward)
+    Pages are drawn onto the shared page_image canvas, which is returned
+    and reused by the next call. When a page is first shown its cached
+    background is copied in and every value is drawn. On later refreshes
+    of the same page only the values whose text changed are redrawn.
+
+    Args:
+        page_num (int): Page number to create (0, 1, or 2)
 
     Returns:
-        bool: True if page changed, False otherwise
+        PIL.Image: Generated page image ready for display
     """
-    global current_page, last_button_a_state, last_button_b_state
+    global page_items, page_image_num
 
-    if not running:
-        return False
+    items = get_page_items(page_num)
+    background = get_page_background(page_num)
 
-    try:
-        # Read current button states (active low - pressed = False)
-        btn_a_pressed = not GPIO.input(BTN_A_PIN)  # Bottom button
-        btn_b_pressed = not GPIO.input(BTN_B_PIN)  # Top button
+    if page_num != page_image_num:
+        # Start from the prerendered background and draw every value
+        page_image.paste(background)
+        for xy, text, fnt, fill in items:
+            draw_text(page_image, xy, text, fnt, fill)
+    else:
+        # Redraw the union of each changed value's old and new bounding box
+        for old, new in zip_longest(page_items, items):
+            if old == new:
+                continue
+            boxes = [page_draw.textbbox(item[0], item[1], font=item[2])
+                     for item in (old, new) if item is not None]
+            redraw_box((min(b[0] for b in boxes), min(b[1] for b in boxes),
+                        max(b[2] for b in boxes), max(b[3] for b in boxes)), items, background)
+
+    page_items = items
+    page_image_num = page_num
+    return page_image
+
+def on_button_press(channel):
+    """
+    Handle a button press reported by RPi.GPIO edge detection.
 
-        page_changed = False
+    Runs on RPi.GPIO's callback thread. Debouncing is done by the
+    bouncetime given to GPIO.add_event_detect. Updates the global
+    current_page and wakes the main loop through button_event.
 
-        # Check left button (GPIO 23) - Previous page
-        # Only trigger on press edge (was not pressed, now pressed)
-        if btn_a_pressed and not last_button_a_state:
-            current_page = (current_page - 1) % 3  # Wrap around: 0->2, 1->0, 2->1
-            print(f"Bottom button pressed! Switched to page {current_page}")
-            page_changed = True
+    Button mapping:
+    - Bottom button (GPIO 23): Previous page (decrements page number)
+    - Top button (GPIO 24): Next page (increments page number)
 
-        # Check right button (GPIO 24) - Next page
-        # Only trigger on press edge (was not pressed, now pressed)
-        if btn_b_pressed and not last_button_b_state:
-            current_page = (current_page + 1) % 3  # Wrap around: 0->1, 1->2, 2->0
-            print(f"Top button pressed! Switched to page {current_page}")
-            page_changed = True
+    Pages wrap around: 0 -> 1 -> 2 -> 0 (forward) or 0 -> 2 -> 1 -> 0 (backward)
 
-        # Update button states for next iteration (debouncing)
-        last_button_a_state = btn_a_pressed
-        last_button_b_state = btn_b_pressed
+    Args:
+        channel (int): BCM pin number of the button that was pressed
+    """
+    global current_page
 
-        return page_changed
+    if not running:
+        return
 
-    except Exception as e:
-        if running:
-            print(f"Button error: {e}")
-        return False
+    if channel == BTN_A_PIN:
+        current_page = (current_page - 1) % 3  # Wrap around: 0->2, 1->0, 2->1
+        print(f"Bottom button pressed! Switched to page {current_page}")
+    elif channel == BTN_B_PIN:
+        current_page = (current_page + 1) % 3  # Wrap around: 0->1, 1->2, 2->0
+        print(f"Top button pressed! Switched to page {current_page}")
+    else:
+        return
+
+    button_event.set()
 
 def main():
     """
@@ -629,13 +987,13 @@ def main():
     Handles:
     - Display initialization
     - Startup screen display
-    - Main monitoring loop with button checking
+    - Main monitoring loop redrawing on button presses
     - Periodic display updates (every 5 seconds)
     - Graceful shutdown on Ctrl+C
 
-    The main loop runs at 10Hz (100ms intervals) for responsive button handling
-    while updating system data every 5 seconds to balance responsiveness with
-    system load.
+    The main loop sleeps until either a button callback signals a page
+    change or the next 5 second data update is due, so it does not wake
+    up between updates.
     """
     global running
 
@@ -661,8 +1019,9 @@ def main():
     display_image_corrected(startup_image)
     time.sleep(3)  # Show startup message for 3 seconds
 
-    # Display initial page (page 0 - system info)
+    # Display initial page (page 0 - system info, or wherever the buttons moved it)
     print("Displaying initial page...")
+    button_event.clear()
     page_image = create_page(current_page)
     display_image_corrected(page_image)
 
@@ -676,28 +1035,24 @@ def main():
     print("  Page 2: Top Processes (Orange title)")
     print("\nPress Ctrl+C to exit")
 
-    last_update = time.time()
+    next_update = time.monotonic() + 5.0
 
     try:
         # Main monitoring loop
         while running:
-            current_time = time.time()
-
-            # Check for button presses and update display if page changed
-            if check_buttons():
+            # Sleep until a button changes the page or the next update is due
+            if button_event.wait(max(0.0, next_update - time.monotonic())):
+                button_event.clear()
                 print(f"Updating display for page {current_page}...")
                 page_image = create_page(current_page)
                 display_image_corrected(page_image)
-                time.sleep(0.1)  # Brief pause after page change for debouncing
 
             # Update display every 5 seconds with fresh data
-            if current_time - last_update >= 5.0:
+            current_time = time.monotonic()
+            if current_time >= next_update:
                 page_image = create_page(current_page)
                 display_image_corrected(page_image)
-                last_update = current_time
-
-            # Sleep briefly to prevent excessive CPU usage while maintaining responsiveness
-            time.sleep(0.1)  # 10Hz loop rate
+                next_update = current_time + 5.0
 
     except KeyboardInterrupt:
         print("\nExiting...")